@@ -1,13 +1,16 @@
 """Base WebSocket client for AsyncAPI."""
 
 import json
+import re
 from traceback import print_exc
 from types import UnionType
-from typing import Annotated, Any
+from typing import Annotated, Any, ClassVar
 
 from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 from websockets.asyncio.client import ClientConnection, connect
 
+_PATH_PARAM_PATTERN = re.compile(r"\{([^{}]+)\}")
+
 
 class BaseClient:
     """Base WebSocket client class."""
@@ -17,6 +20,10 @@ class BaseClient:
     incoming_message: type[BaseModel] | UnionType
     discriminator_field: str = "action"
 
+    # Class-invariant state, built once per client class on first instantiation
+    _path_segments: ClassVar[list[str]]
+    _incoming_message_adapter: ClassVar[TypeAdapter[BaseModel]]
+
     def __init__(
         self,
         base_url: str,
@@ -43,17 +50,48 @@ class BaseClient:
         # Replace path parameters in the path
         path = self.path
         if path_params:
-            for param_name, param_value in path_params.items():
-                path = path.replace(f"{{{param_name}}}", str(param_value))
+            # Odd segments are parameter names, unknown ones are kept as-is
+            path = "".join(
+                (
+                    str(path_params.get(segment, f"{{{segment}}}"))
+                    if index % 2
+                    else segment
+                )
+                for index, segment in enumerate(self._get_path_segments())
+            )
 
         self.url = base_url + path
 
-        self.incoming_message_adapter = TypeAdapter[BaseModel](
-            Annotated[
-                self.incoming_message,
-                Field(discriminator=self.discriminator_field),
-            ]
-        )
+        self.incoming_message_adapter = self._get_incoming_message_adapter()
+
+    @classmethod
+    def _get_path_segments(cls) -> list[str]:
+        """
+        Split the path template into literal and parameter segments once per class.
+
+        Returns:
+            Segments alternating between literal text and parameter names
+        """
+        if "_path_segments" not in cls.__dict__:
+            cls._path_segments = _PATH_PARAM_PATTERN.split(cls.path)
+        return cls._path_segments
+
+    @classmethod
+    def _get_incoming_message_adapter(cls) -> TypeAdapter[BaseModel]:
+        """
+        Build the incoming message adapter once per class.
+
+        Returns:
+            TypeAdapter validating the discriminated union of incoming messages
+        """
+        if "_incoming_message_adapter" not in cls.__dict__:
+            cls._incoming_message_adapter = TypeAdapter[BaseModel](
+                Annotated[
+                    cls.incoming_message,
+                    Field(discriminator=cls.discriminator_field),
+                ]
+            )
+        return cls._incoming_message_adapter
 
     async def send_init_message(self) -> None:
         """Send initial message after connection is established."""
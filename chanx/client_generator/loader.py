@@ -3,10 +3,31 @@
 import json
 from pathlib import Path
 from typing import Any, cast
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 import yaml
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+_URL_SCHEMES = frozenset(("http", "https"))
+
+# libyaml-backed loader when PyYAML was built with it, same safe subset
+_YamlLoader: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _json_loads(content: str | bytes) -> Any:
+    """Parse JSON with orjson when it is installed, else with the stdlib."""
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson rejects some documents json accepts, e.g. NaN or big ints
+            pass
+    return json.loads(content)
+
 
 class SchemaLoader:
     """Load AsyncAPI schemas from files or URLs."""
@@ -37,12 +58,12 @@ class SchemaLoader:
 
     @staticmethod
     def _is_url(path_or_url: str) -> bool:
-        """Check if the input is a URL."""
+        """Check if the input is an HTTP(S) URL."""
         try:
-            result = urlparse(path_or_url)
-            return all([result.scheme, result.netloc])
-        except Exception:
+            result = urlsplit(path_or_url)
+        except ValueError:
             return False
+        return result.scheme in _URL_SCHEMES and bool(result.netloc)
 
     @staticmethod
     def _load_from_url(url: str) -> dict[str, Any]:
@@ -109,7 +130,8 @@ class SchemaLoader:
         if not schema_path.exists():
             raise FileNotFoundError(f"Schema file not found: {path}")
 
-        content = schema_path.read_text(encoding="utf-8")
+        # Both parsers take raw bytes and detect the encoding themselves
+        content = schema_path.read_bytes()
 
         # Determine format from extension
         suffix = schema_path.suffix.lower()
@@ -123,10 +145,10 @@ class SchemaLoader:
             return SchemaLoader._load_auto(content, path)
 
     @staticmethod
-    def _load_json(content: str) -> dict[str, Any]:
+    def _load_json(content: str | bytes) -> dict[str, Any]:
         """Load JSON content."""
         try:
-            data = json.loads(content)
+            data = _json_loads(content)
             if not isinstance(data, dict):
                 raise ValueError("Schema must be a JSON object")
             return cast(dict[str, Any], data)
@@ -134,10 +156,10 @@ class SchemaLoader:
             raise ValueError(f"Invalid JSON format: {e}") from e
 
     @staticmethod
-    def _load_yaml(content: str) -> dict[str, Any]:
+    def _load_yaml(content: str | bytes) -> dict[str, Any]:
         """Load YAML content."""
         try:
-            data = yaml.safe_load(content)
+            data = yaml.load(content, Loader=_YamlLoader)
             if not isinstance(data, dict):
                 raise ValueError("Schema must be a YAML object")
             return cast(dict[str, Any], data)
@@ -145,7 +167,7 @@ class SchemaLoader:
             raise ValueError(f"Invalid YAML format: {e}") from e
 
     @staticmethod
-    def _load_auto(content: str, path: str) -> dict[str, Any]:
+    def _load_auto(content: str | bytes, path: str) -> dict[str, Any]:
         """Auto-detect and load content."""
         # Try JSON first
         try:
@@ -108,14 +108,15 @@ def _base_handler(  # noqa
         final_output_type = output_type
         final_action = action
 
-        # Get type hints from function signature
-        type_hints = get_type_hints(fn)
-        sig = inspect.signature(fn)
-
-        params = list(sig.parameters.values())
-        remain = params[1:] if len(params) > 1 else []
+        # Get type hints from function signature, only when a type must be inferred
+        type_hints = (
+            get_type_hints(fn) if not (final_input_type and final_output_type) else {}
+        )
 
         if not final_input_type:
+            params = list(inspect.signature(fn).parameters.values())
+            remain = params[1:] if len(params) > 1 else []
+
             if not remain:
                 raise ValueError(
                     "Must provide input type either by annotate function or input_type parameter"
@@ -6,7 +6,8 @@ and generate JSON schemas. Originally used for AsyncAPI generation, but now
 serves as the core message type registry for the chanx framework.
 """
 
-from collections import defaultdict
+import threading
+from collections import defaultdict, deque
 from types import UnionType
 from typing import Any, TypeAlias, Union, cast, get_args, get_origin, get_type_hints
 
@@ -20,6 +21,12 @@ MessageSchema: TypeAlias = dict[str, Any]
 
 MessageRef: TypeAlias = str
 SchemaRef: TypeAlias = str
+MessageTypeSpec: TypeAlias = (
+    type[BaseMessage]
+    | list[type[BaseMessage]]
+    | tuple[type[BaseMessage], ...]
+    | UnionType
+)
 
 UNION_TYPES = (Union, UnionType)
 
@@ -67,18 +74,75 @@ class MessageRegistry:
     """Registry for collecting and managing message types from consumers."""
 
     def __init__(self) -> None:
-        self.schemas: dict[type[BaseModel], SchemaRef] = {}
-        self.messages: dict[type[BaseMessage], MessageRef] = {}
+        # Types passed to add(), built lazily on the first read of the registry
+        self._pending: deque[tuple[MessageTypeSpec, str]] = deque()
+        self._build_lock = threading.Lock()
+
+        self._schemas: dict[type[BaseModel], SchemaRef] = {}
+        self._messages: dict[type[BaseMessage], MessageRef] = {}
         self._schema_names: set[str] = set()
 
-        self.remap_schema_title: dict[type[BaseModel], str] = {}
+        self._remap_schema_title: dict[type[BaseModel], str] = {}
 
-        self.schema_objects: dict[str, dict[str, Any]] = {}
-        self.message_objects: dict[str, dict[str, Any]] = {}
-        self.consumer_messages = defaultdict[str, set[type[BaseMessage]]](
+        self._schema_objects: dict[str, dict[str, Any]] = {}
+        self._message_objects: dict[str, dict[str, Any]] = {}
+        self._consumer_messages = defaultdict[str, set[type[BaseMessage]]](
             set[type[BaseMessage]]
         )
 
+    @property
+    def schemas(self) -> dict[type[BaseModel], SchemaRef]:
+        """Schema references keyed by model type."""
+        self._build_pending()
+        return self._schemas
+
+    @property
+    def messages(self) -> dict[type[BaseMessage], MessageRef]:
+        """Message references keyed by message type."""
+        self._build_pending()
+        return self._messages
+
+    @property
+    def remap_schema_title(self) -> dict[type[BaseModel], str]:
+        """Schema titles renamed to avoid naming conflicts, keyed by model type."""
+        self._build_pending()
+        return self._remap_schema_title
+
+    @property
+    def schema_objects(self) -> dict[str, dict[str, Any]]:
+        """JSON schemas keyed by schema title."""
+        self._build_pending()
+        return self._schema_objects
+
+    @property
+    def message_objects(self) -> dict[str, dict[str, Any]]:
+        """AsyncAPI message objects keyed by message name."""
+        self._build_pending()
+        return self._message_objects
+
+    @property
+    def consumer_messages(self) -> defaultdict[str, set[type[BaseMessage]]]:
+        """Message types keyed by the name of the consumer using them."""
+        self._build_pending()
+        return self._consumer_messages
+
+    def _build_pending(self) -> None:
+        """
+        Build schemas and messages for all types queued by add(), in add order.
+
+        Schema generation is only needed for AsyncAPI documentation, so it is
+        deferred from consumer class creation to the first read of the registry.
+        An error building a type is raised from that read, and again from every
+        later read, as the failing entry stays at the head of the queue.
+        """
+        # Readers always take the lock so none sees a build still in progress
+        with self._build_lock:
+            while self._pending:
+                message_type, consumer_name = self._pending[0]
+                # Building is idempotent, so a failed entry can be retried as is
+                self._add(message_type, consumer_name)
+                self._pending.popleft()
+
     def build_message(
         self, message_type: type[BaseMessage], consumer_name: str
     ) -> None:
@@ -86,40 +150,43 @@ class MessageRegistry:
         Build and register a message type in the registry.
 
         Note: This method expects a single BaseMessage type, not a union/list/tuple.
-        Union/list/tuple handling is done in the add() method.
+        Union/list/tuple handling is done in the _add() method.
 
         Args:
             message_type: The BaseMessage subclass to register
             consumer_name: Name of the consumer using this message type
         """
-        self.consumer_messages[consumer_name].add(message_type)
-        if message_type not in self.messages:
-            message_title = self.remap_schema_title.get(
+        self._consumer_messages[consumer_name].add(message_type)
+        if message_type not in self._messages:
+            message_title = self._remap_schema_title.get(
                 message_type, message_type.__name__
             )
             message_name = humps.depascalize(message_title)
 
             message_schema = SchemaObject()
-            message_schema.ref = self.schemas.get(message_type)
+            message_schema.ref = self._schemas.get(message_type)
 
-            self.message_objects[message_name] = {
+            self._message_objects[message_name] = {
                 "payload": message_schema.model_dump(by_alias=True, exclude_none=True)
             }
 
-            self.messages[message_type] = get_asyncapi_message_ref(message_name)
+            self._messages[message_type] = get_asyncapi_message_ref(message_name)
 
-    def add(
-        self,
-        message_type: (
-            type[BaseMessage]
-            | list[type[BaseMessage]]
-            | tuple[type[BaseMessage], ...]
-            | UnionType
-        ),
-        consumer_name: str,
-    ) -> None:
+    def add(self, message_type: MessageTypeSpec, consumer_name: str) -> None:
+        """
+        Queue a message type, union, list, or tuple for the registry.
+
+        Schemas are built the next time any registry collection is read.
+
+        Args:
+            message_type: The BaseMessage type, union, list, or tuple to add
+            consumer_name: Name of the consumer using this message type
+        """
+        self._pending.append((message_type, consumer_name))
+
+    def _add(self, message_type: MessageTypeSpec, consumer_name: str) -> None:
         """
-        Add a message type to the registry, handling simple types, unions, lists, and tuples.
+        Build and register a message type, handling simple types, unions, lists, and tuples.
 
         Args:
             message_type: The BaseMessage type, union, list, or tuple to add
@@ -185,7 +252,7 @@ class MessageRegistry:
             prefix = clean_consumer_name(consumer_name)
             retitle = prefix + model_schema["title"]
             model_schema["title"] = retitle
-            self.remap_schema_title[model_type] = retitle
+            self._remap_schema_title[model_type] = retitle
 
     def _process_field_types(
         self, model_type_fields: dict[str, Any], consumer_name: str
@@ -259,7 +326,7 @@ class MessageRegistry:
             if "$ref" in dict_obj:
                 ref = dict_obj["$ref"]
                 if isinstance(ref, str) and ref.startswith("#/$defs/"):
-                    schema_name = ref.replace("#/$defs/", "")
+                    schema_name = ref.removeprefix("#/$defs/")
                     if schema_name in defs_to_schemas:
                         dict_obj["$ref"] = defs_to_schemas[schema_name]
             for value in dict_obj.values():
@@ -301,13 +368,13 @@ class MessageRegistry:
 
         if ref_fields:
             for ref in ref_fields:
-                properties[ref] = {"$ref": self.schemas[model_type_fields[ref]]}
+                properties[ref] = {"$ref": self._schemas[model_type_fields[ref]]}
 
         if union_map:
             for ref_name, ref_map in union_map.items():
                 field = properties[ref_name]["anyOf"]
                 for idx, model in ref_map.items():
-                    field[idx]["$ref"] = self.schemas[model]
+                    field[idx]["$ref"] = self._schemas[model]
 
         # Recursively update all remaining $ref pointers in the main schema
         self._update_ref_recursively(model_schema, defs_to_schemas)
@@ -319,8 +386,8 @@ class MessageRegistry:
                 self._update_ref_recursively(def_schema, defs_to_schemas)
 
                 # Only store if not already present (avoid duplicates)
-                if def_name not in self.schema_objects:
-                    self.schema_objects[def_name] = def_schema
+                if def_name not in self._schema_objects:
+                    self._schema_objects[def_name] = def_schema
 
     def build_message_schema(
         self, model_type: type[BaseModel] | UnionType, consumer_name: str
@@ -346,7 +413,7 @@ class MessageRegistry:
         concrete_type = cast(type[BaseModel], model_type)
 
         # Skip if already processed
-        if concrete_type in self.schemas:
+        if concrete_type in self._schemas:
             return
 
         # Generate base schema
@@ -365,8 +432,8 @@ class MessageRegistry:
         )
 
         # Store the schema
-        self.schemas[concrete_type] = get_asyncapi_schema_ref(model_schema["title"])
-        self.schema_objects[model_schema["title"]] = model_schema
+        self._schemas[concrete_type] = get_asyncapi_schema_ref(model_schema["title"])
+        self._schema_objects[model_schema["title"]] = model_schema
         self._schema_names.add(concrete_type.__name__)
 
 
@@ -165,6 +165,7 @@ class WebsocketCommunicatorMixin:
         self,
         stop_action: COMPLETE_ACTIONS_TYPE | str = MESSAGE_ACTION_COMPLETE,
         timeout: float = 1,
+        count: int | None = None,
     ) -> list[BaseMessage]:
         """
         Receives and collects JSON messages until a specific action is received.
@@ -174,6 +175,9 @@ class WebsocketCommunicatorMixin:
         Args:
             stop_action: The action type to stop collecting at
             timeout: Maximum time to wait for messages (in seconds)
+            count: Stop as soon as this many messages have been collected, without
+                waiting for stop_action. Useful when completion messages are
+                disabled and the number of expected messages is known.
 
         Returns:
             List of received JSON messages (excluding completion messages)
@@ -201,7 +205,9 @@ class WebsocketCommunicatorMixin:
                         )
                         messages.append(message)
 
-                    if message_action == stop_action:
+                    if message_action == stop_action or (
+                        count is not None and len(messages) >= count
+                    ):
                         break
         except (asyncio.CancelledError, asyncio.TimeoutError):
             pass
@@ -148,15 +148,19 @@ class ChanxWebsocketConsumerMixin(Generic[ReceiveEvent]):
                 continue
 
             # Process WebSocket handlers
-            if hasattr(attr, "_ws_handler_info"):
-                ws_handler_info: AsyncAPIHandlerInfo = attr._ws_handler_info
+            ws_handler_info: AsyncAPIHandlerInfo | None = getattr(
+                attr, "_ws_handler_info", None
+            )
+            if ws_handler_info is not None:
                 cls._MESSAGE_HANDLER_INFO_MAP[ws_handler_info["message_action"]] = (
                     ws_handler_info
                 )
 
             # Process event handlers
-            if hasattr(attr, "_event_handler_info"):
-                event_handler_info: AsyncAPIHandlerInfo = attr._event_handler_info
+            event_handler_info: AsyncAPIHandlerInfo | None = getattr(
+                attr, "_event_handler_info", None
+            )
+            if event_handler_info is not None:
                 cls._EVENT_HANDLER_INFO_MAP[event_handler_info["message_action"]] = (
                     event_handler_info
                 )
@@ -600,6 +604,11 @@ class ChanxWebsocketConsumerMixin(Generic[ReceiveEvent]):
         This is useful for implementing pub/sub patterns where messages
         need to be distributed to multiple connected clients.
 
+        Delivery always goes through the channel layer, even for groups that
+        only have local members: group membership is owned by the layer and
+        may span several worker processes, so a consumer cannot safely short
+        circuit the send based on what it sees in its own process.
+
         Args:
             message: Message object to send to the groups.
             groups: Group names to send to (defaults to self.groups)
@@ -67,13 +67,17 @@ class BaseMessage(BaseModel, abc.ABC):
         if "action" not in cls.__annotations__:
             raise TypeError(f"Class {cls.__name__!r} must define an 'action' field")
 
-        try:
-            hints = get_type_hints(cls)
-            action_field = hints["action"]
-        except (KeyError, AttributeError) as e:
-            raise TypeError(
-                f"Class {cls.__name__!r} must define an 'action' field"
-            ) from e
+        action_field = cls.__annotations__["action"]
+
+        # A raw Literal is the common case; anything else (postponed string
+        # annotations, Annotated wrappers, aliases) is resolved via get_type_hints
+        if get_origin(action_field) is not Literal:  # type: ignore[comparison-overlap,unused-ignore]
+            try:
+                action_field = get_type_hints(cls)["action"]
+            except (KeyError, AttributeError) as e:
+                raise TypeError(
+                    f"Class {cls.__name__!r} must define an 'action' field"
+                ) from e
 
         if get_origin(action_field) is not Literal:  # type: ignore[comparison-overlap,unused-ignore]
             raise TypeError(
@@ -58,8 +58,10 @@ class BackgroundJobConsumer(ExtraEventHandlerMixin, BaseConsumer[AllEvent]):
                 )
             )
 
-            # Queue the real background job (now async)
-            job_id = await queue_job(job_type, content, self.channel_name)
+            # Queue the real background job through the app's shared ARQ pool,
+            # which the server passes in from the lifespan state
+            arq_pool = self.scope.get("state", {}).get("arq_pool")
+            job_id = await queue_job(job_type, content, self.channel_name, arq_pool)
 
             await self.send_message(
                 JobStatusMessage(
@@ -25,6 +25,7 @@ from .messages import (
     ReliableChatNotificationMessage,
     ReliableChatPayload,
     SystemNotify,
+    SystemNotifyBatch,
     SystemPeriodicNotify,
 )
 
@@ -221,7 +222,7 @@ class NotificationConsumer(BaseConsumer):
     description="Analytics Consumer for reliable event delivery",
     tags=["analytics", "showcase"],
 )
-class AnalyticsConsumer(BaseConsumer[SystemNotify]):
+class AnalyticsConsumer(BaseConsumer[SystemNotify | SystemNotifyBatch]):
     """
     Consumer for analytics events with reliable delivery.
     Migrated to use chanx framework.
@@ -262,3 +263,13 @@ class AnalyticsConsumer(BaseConsumer[SystemNotify]):
                 event=f"{event.payload}",
             )
         )
+
+    @event_handler(output_type=AnalyticsNotificationMessage)
+    async def system_notify_analytic_batch(self, event: SystemNotifyBatch) -> None:
+        """Fan a batch of analytics events out to the client, one frame each."""
+        for event_name in event.payload:
+            await self.send_message(
+                AnalyticsNotificationMessage(
+                    payload=AnalyticsPayload(event=event_name),
+                )
+            )
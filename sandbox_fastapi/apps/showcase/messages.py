@@ -94,3 +94,8 @@ class SystemNotify(BaseMessage):
 class SystemPeriodicNotify(BaseMessage):
     action: Literal["system_periodic_notify"] = "system_periodic_notify"
     payload: str
+
+
+class SystemNotifyBatch(BaseMessage):
+    action: Literal["system_notify_batch"] = "system_notify_batch"
+    payload: list[str]
@@ -1,4 +1,8 @@
-from typing import Any
+import asyncio
+import sys
+import uuid
+from collections.abc import AsyncIterator
+from typing import Any, cast
 
 import pytest
 import pytest_asyncio
@@ -7,13 +11,36 @@ from arq.worker import Worker
 
 from fast_channels.layers.registry import channel_layers
 
-from .layers import setup_layers
+from . import tasks
+from .layers import close_layers, setup_layers
 from .tasks import REDIS_SETTINGS, WorkerSettings
 
 
-@pytest_asyncio.fixture(scope="function")
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run the sandbox tests on uvloop when it is available."""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return cast(asyncio.AbstractEventLoopPolicy, uvloop.EventLoopPolicy())
+    return asyncio.get_event_loop_policy()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def bg_worker() -> Any:
-    """Create a real ARQ worker for testing."""
+    """
+    Create a real ARQ worker shared by every test in a module.
+
+    Tests using it must run on the module event loop, as the worker's Redis
+    pool is bound to the loop it was created on. Jobs go to a queue unique to
+    this worker, so no other worker can take them and Redis never needs
+    flushing between runs. Tests pass the worker's pool to the app as lifespan
+    state, so queue_job enqueues through the same pool.
+    """
+    queue_name = f"arq:queue:{uuid.uuid4().hex}"
     redis = await create_pool(REDIS_SETTINGS)
 
     worker = Worker(
@@ -21,9 +48,12 @@ async def bg_worker() -> Any:
         redis_pool=redis,
         burst=True,
         poll_delay=0.1,
+        queue_name=queue_name,
     )
 
-    yield worker
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(tasks, "QUEUE_NAME", queue_name)
+        yield worker
     await redis.aclose()
 
 
@@ -39,3 +69,10 @@ def fresh_redis_layers(worker_id: str) -> None:
 
     # Re-setup with fresh instances
     setup_layers(True, wid)
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def close_redis_layers() -> AsyncIterator[None]:
+    """Close Redis connection pools opened on each test's event loop."""
+    yield
+    await close_layers()
@@ -12,7 +12,11 @@ from sandbox_fastapi.apps.showcase.consumer import (
     NotificationConsumer,
     ReliableChatConsumer,
 )
-from sandbox_fastapi.apps.showcase.messages import SystemNotify, SystemPeriodicNotify
+from sandbox_fastapi.apps.showcase.messages import (
+    SystemNotify,
+    SystemNotifyBatch,
+    SystemPeriodicNotify,
+)
 from sandbox_fastapi.layers import setup_layers
 
 if len(channel_layers) == 0:
@@ -65,11 +69,10 @@ async def send_analytics_event() -> None:
         "error:api_timeout",
     ]
 
-    for event in events:
-        await AnalyticsConsumer.broadcast_event(
-            SystemNotify(payload=event),
-        )
-        await asyncio.sleep(0.1)  # Small delay between events
+    # One channel layer round trip for the whole batch
+    await AnalyticsConsumer.broadcast_event(
+        SystemNotifyBatch(payload=events),
+    )
 
     print(f"✅ Sent {len(events)} analytics events!")
 
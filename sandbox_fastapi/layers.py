@@ -7,6 +7,7 @@ import os
 
 from fast_channels.layers import (
     InMemoryChannelLayer,
+    channel_layers,
     has_layers,
     register_channel_layer,
 )
@@ -62,3 +63,17 @@ def setup_layers(force: bool = False, worker_id: int | None = None) -> None:
     # Register all layers
     for alias, layer in layers_config.items():
         register_channel_layer(alias, layer)
+
+
+async def close_layers() -> None:
+    """
+    Close the Redis connections opened by the registered layers.
+    Redis layers keep one connection pool per event loop, so this must be
+    awaited on the loop that used them (e.g. at the end of each test).
+    """
+    for alias in channel_layers.list_aliases():
+        layer = channel_layers[alias]
+        if isinstance(layer, RedisChannelLayer):
+            await layer.close_pools()
+        elif isinstance(layer, RedisPubSubChannelLayer):
+            await layer.flush()
@@ -5,6 +5,12 @@ This is the complete implementation showcasing all fast-channels features.
 See tutorial/ directory for step-by-step learning files.
 """
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from arq import create_pool
+from arq.connections import ArqRedis
+
 # Setup chanx FastAPI integration
 from chanx.fast_channels import (
     asyncapi_docs,
@@ -36,10 +42,22 @@ from sandbox_fastapi.apps.system_chat.consumer import (
 
 # Setup channel layers configuration
 from sandbox_fastapi.layers import setup_layers
+from sandbox_fastapi.tasks import REDIS_SETTINGS
 
 setup_layers()
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[dict[str, ArqRedis]]:
+    """Open one ARQ pool for the app; consumers read it from the lifespan state."""
+    arq_pool = await create_pool(REDIS_SETTINGS)
+    try:
+        yield {"arq_pool": arq_pool}
+    finally:
+        await arq_pool.aclose()
+
+
+app = FastAPI(lifespan=lifespan)
 
 
 # Add chanx AsyncAPI documentation manually
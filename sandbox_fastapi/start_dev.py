@@ -12,6 +12,7 @@ This will start:
 Both processes will be managed together and stopped with Ctrl+C.
 """
 
+import os
 import signal
 import subprocess
 import sys
@@ -19,6 +20,23 @@ import time
 from types import FrameType
 
 import uvicorn
+from redis import Redis
+
+# Add the project root to Python path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sandbox_fastapi.tasks import WORKER_READY_KEY, redis_url  # noqa: E402
+
+
+def wait_for_worker(process: subprocess.Popen[bytes], timeout: float = 10.0) -> bool:
+    """Poll Redis until the worker has run its startup hook or timeout expires."""
+    deadline = time.monotonic() + timeout
+    with Redis.from_url(redis_url) as redis:
+        while time.monotonic() < deadline and process.poll() is None:
+            if redis.get(WORKER_READY_KEY):
+                return True
+            time.sleep(0.05)
+    return False
 
 
 def main() -> None:  # noqa
@@ -50,12 +68,15 @@ def main() -> None:  # noqa
     try:
         # Start ARQ worker using CLI
         print("🔄 Starting ARQ worker...")
+        with Redis.from_url(redis_url) as redis:
+            redis.delete(WORKER_READY_KEY)
         worker_process = subprocess.Popen(
             [sys.executable, "-m", "arq", "sandbox_fastapi.tasks.WorkerSettings"]
         )
 
-        # Give worker a moment to start
-        time.sleep(2)
+        # Wait until the worker reports it is ready instead of sleeping blindly
+        if not wait_for_worker(worker_process):
+            print("⚠️ ARQ worker not ready yet, starting FastAPI anyway...")
 
         # Start FastAPI app
         print("🌐 Starting FastAPI application...")
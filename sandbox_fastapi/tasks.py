@@ -5,10 +5,12 @@ ARQ-based background tasks for the sandbox_fastapi application.
 import asyncio
 import os
 import time
+import uuid
 from typing import Any
 
 from arq import create_pool
-from arq.connections import RedisSettings
+from arq.connections import ArqRedis, RedisSettings
+from arq.constants import default_queue_name
 
 from sandbox_fastapi.apps.background_jobs.messages import JobResult
 from sandbox_fastapi.layers import setup_layers
@@ -19,17 +21,24 @@ from sandbox_fastapi.layers import setup_layers
 redis_url = os.getenv("REDIS_URL", "redis://localhost:6363")
 REDIS_SETTINGS = RedisSettings.from_dsn(redis_url)
 
+# Queue the jobs are pushed to and the worker polls
+QUEUE_NAME = os.getenv("ARQ_QUEUE_NAME", default_queue_name)
+
+# Key the worker sets once it is ready to pick up jobs (see start_dev.py)
+WORKER_READY_KEY = "sandbox_fastapi:worker_ready"
+
 
 async def startup(ctx: dict[str, Any]) -> None:
     """Initialize resources when worker starts."""
     # You can set up shared resources here like HTTP clients, database connections, etc.
     setup_layers()
+    await ctx["redis"].set(WORKER_READY_KEY, "1", ex=30)
 
 
 async def shutdown(ctx: dict[str, Any]) -> None:
     """Clean up resources when worker shuts down."""
     # Clean up any shared resources
-    pass
+    await ctx["redis"].delete(WORKER_READY_KEY)
 
 
 async def translate(
@@ -169,19 +178,23 @@ JOB_FUNCTIONS = {
 }
 
 
-async def queue_job(job_type: str, content: str, channel_name: str) -> str:
+async def queue_job(
+    job_type: str, content: str, channel_name: str, pool: ArqRedis | None = None
+) -> str:
     """
     Queue a background job and return the job ID.
+
+    Jobs are enqueued through ``pool`` when given, e.g. the app's shared pool;
+    otherwise a connection is opened and closed for this call.
     """
     if job_type not in JOB_FUNCTIONS:
         job_type = "default"
 
-    # Create ARQ pool connection
-    redis = await create_pool(REDIS_SETTINGS)
+    redis = pool if pool is not None else await create_pool(REDIS_SETTINGS)
 
     try:
-        # Generate job ID
-        job_id = f"{job_type}_{int(time.time())}"
+        # Generate a unique job ID: ARQ skips jobs whose ID is already queued
+        job_id = f"{job_type}_{int(time.time())}_{uuid.uuid4().hex[:8]}"
 
         # Enqueue the job
         job = await redis.enqueue_job(
@@ -189,12 +202,14 @@ async def queue_job(job_type: str, content: str, channel_name: str) -> str:
             job_id,
             content,
             channel_name,
+            _queue_name=QUEUE_NAME,
         )
 
         return job.job_id if job else job_id
 
     finally:
-        await redis.aclose()
+        if pool is None:
+            await redis.aclose()
 
 
 class WorkerSettings:
@@ -206,6 +221,7 @@ class WorkerSettings:
     on_startup = startup
     on_shutdown = shutdown
     redis_settings = REDIS_SETTINGS
+    queue_name = QUEUE_NAME
     # Optional: configure other settings
     max_jobs = 10
     job_timeout = 300  # 5 minutes
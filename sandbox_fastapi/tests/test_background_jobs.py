@@ -1,6 +1,8 @@
+from collections.abc import AsyncIterator
 from typing import Any, cast
 
 import pytest
+import pytest_asyncio
 from chanx.constants import EVENT_ACTION_COMPLETE
 from chanx.fast_channels.testing import WebsocketCommunicator
 from chanx.messages.incoming import PingMessage
@@ -13,10 +15,34 @@ from sandbox_fastapi.apps.background_jobs.messages import (
     JobStatusMessage,
 )
 from sandbox_fastapi.apps.mixins import ExtraEventMessage, ExtraResponseMessage
+from sandbox_fastapi.layers import close_layers
 from sandbox_fastapi.main import app
 
+# Share the module-scoped bg_worker (and its Redis pool) across tests
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+def job_communicator(bg_worker: Any) -> WebsocketCommunicator:
+    """
+    Connect to the jobs consumer with the worker's ARQ pool as lifespan state.
+
+    The server passes the app's lifespan state into each connection scope; the
+    communicator does not run the lifespan, so the test worker's pool is used.
+    """
+    comm = WebsocketCommunicator(
+        app, "/ws/background_jobs", consumer=BackgroundJobConsumer
+    )
+    comm.scope["state"] = {"arq_pool": bg_worker.pool}
+    return comm
+
+
+@pytest_asyncio.fixture(autouse=True, loop_scope="module")
+async def close_redis_layers() -> AsyncIterator[None]:
+    """Close layer connections on the module loop these tests run on."""
+    yield
+    await close_layers()
+
 
-@pytest.mark.asyncio
 async def test_connection_established_and_ping_handler() -> None:
     """Test ping-pong functionality."""
     async with WebsocketCommunicator(
@@ -37,7 +63,6 @@ async def test_connection_established_and_ping_handler() -> None:
         assert replies == [PongMessage()]
 
 
-@pytest.mark.asyncio
 async def test_extra_event_handler_from_mixin() -> None:
     """Test extra event handler provided by ExtraEventHandlerMixin."""
     async with WebsocketCommunicator(
@@ -55,12 +80,9 @@ async def test_extra_event_handler_from_mixin() -> None:
         assert replies == [ExtraResponseMessage(payload="test any extra thing")]
 
 
-@pytest.mark.asyncio
 async def test_job_success(bg_worker: Any) -> None:
     """Test successful job queuing."""
-    async with WebsocketCommunicator(
-        app, "/ws/background_jobs", consumer=BackgroundJobConsumer
-    ) as comm:
+    async with job_communicator(bg_worker) as comm:
         # Skip connection message
         await comm.receive_all_messages(stop_action="job_status")
 
@@ -98,69 +120,59 @@ async def test_job_success(bg_worker: Any) -> None:
         )
 
 
-async def send_job_and_process(job_type: str, content: str, bg_worker: Any) -> str:
-    """Helper to send job and process with worker."""
-    async with WebsocketCommunicator(
-        app, "/ws/background_jobs", consumer=BackgroundJobConsumer
-    ) as comm:
-        await comm.receive_all_messages(stop_action="job_status")  # Skip connection
+async def test_job_types(bg_worker: Any) -> None:
+    """Test every job type over one socket, with unknown types using default."""
+    jobs = [
+        ("analyze", "hello world test"),
+        ("generate", "weather today"),
+        ("generate", "what to eat"),
+        ("generate", "need help"),
+        ("default", "test content"),
+        ("invalid_type", "test content"),
+    ]
 
-        await comm.send_message(
-            JobMessage(payload=JobPayload(type=job_type, content=content))
-        )
-        await comm.receive_all_messages()  # Skip queuing messages
-        await bg_worker.async_run()
+    async with job_communicator(bg_worker) as comm:
+        await comm.receive_all_messages(stop_action="job_status")  # Skip connection
 
-        results = await comm.receive_all_messages(stop_action=EVENT_ACTION_COMPLETE)
-        result = cast(JobStatusMessage, results[0])
-        return cast(str, result.payload["message"])
+        for job_type, content in jobs:
+            await comm.send_message(
+                JobMessage(payload=JobPayload(type=job_type, content=content))
+            )
+            await comm.receive_all_messages()  # Skip queuing messages
 
+        # One worker run processes all queued jobs concurrently
+        await bg_worker.async_run()
 
-@pytest.mark.asyncio
-async def test_analyze_job(bg_worker: Any) -> None:
-    """Test analyze job type."""
-    result = await send_job_and_process("analyze", "hello world test", bg_worker)
-    assert "📊 Analysis of" in result and "Words: 3" in result
+        # Each result is followed by its own event completion message
+        results: list[str] = []
+        for _ in jobs:
+            replies = await comm.receive_all_messages(stop_action=EVENT_ACTION_COMPLETE)
+            result = cast(JobStatusMessage, replies[0])
+            results.append(cast(str, result.payload["message"]))
 
+    # Results arrive in completion order, so match them by the quoted content
+    def result_for(content: str) -> str:
+        return next(result for result in results if f"'{content}'" in result)
 
-@pytest.mark.asyncio
-async def test_generate_weather_job(bg_worker: Any) -> None:
-    """Test generate job with weather query."""
-    result = await send_job_and_process("generate", "weather today", bg_worker)
-    assert "🤖 AI Response" in result and "weather" in result.lower()
+    analysis = result_for("hello world test")
+    assert "📊 Analysis of" in analysis and "Words: 3" in analysis
 
+    weather = result_for("weather today")
+    assert "🤖 AI Response" in weather and "weather" in weather.lower()
 
-@pytest.mark.asyncio
-async def test_generate_food_job(bg_worker: Any) -> None:
-    """Test generate job with food query."""
-    result = await send_job_and_process("generate", "what to eat", bg_worker)
-    assert "🤖 AI Response" in result and (
-        "restaurant" in result.lower() or "pasta" in result.lower()
+    food = result_for("what to eat")
+    assert "🤖 AI Response" in food and (
+        "restaurant" in food.lower() or "pasta" in food.lower()
     )
 
+    help_result = result_for("need help")
+    assert "🤖 AI Response" in help_result and "help" in help_result.lower()
 
-@pytest.mark.asyncio
-async def test_generate_help_job(bg_worker: Any) -> None:
-    """Test generate job with help query."""
-    result = await send_job_and_process("generate", "need help", bg_worker)
-    assert "🤖 AI Response" in result and "help" in result.lower()
-
-
-@pytest.mark.asyncio
-async def test_default_job(bg_worker: Any) -> None:
-    """Test default job type."""
-    result = await send_job_and_process("default", "test content", bg_worker)
-    assert result == "✅ Processed: TEST CONTENT"
-
-
-@pytest.mark.asyncio
-async def test_invalid_job_type(bg_worker: Any) -> None:
-    """Test invalid job type defaults to default."""
-    result = await send_job_and_process("invalid_type", "test content", bg_worker)
-    assert result == "✅ Processed: TEST CONTENT"
+    # Both the default and the unknown job type are processed by default
+    processed = [result for result in results if result.startswith("✅")]
+    assert processed == ["✅ Processed: TEST CONTENT", "✅ Processed: TEST CONTENT"]
 
 
-@pytest.mark.asyncio
 async def test_job_queuing_error() -> None:
     """Test job queuing error handling."""
     async with WebsocketCommunicator(
@@ -198,16 +210,33 @@ async def test_job_queuing_error() -> None:
             assert "Redis connection failed" in error_msg.payload["message"]
 
 
-@pytest.mark.asyncio
 async def test_translations(bg_worker: Any) -> None:
-    """Test translation variations."""
+    """Test translation variations queued over one socket and drained at once."""
     test_cases = [
         ("hello", "hola"),
         ("world", "mundo"),
         ("unknown phrase", "[TRANSLATED: unknown phrase]"),
     ]
 
-    for input_text, expected_translation in test_cases:
-        result = await send_job_and_process("translate", input_text, bg_worker)
-        expected = f"🌍 Translated: '{input_text}' → '{expected_translation}'"
-        assert result == expected
+    async with job_communicator(bg_worker) as comm:
+        await comm.receive_all_messages(stop_action="job_status")  # Skip connection
+
+        for input_text, _ in test_cases:
+            await comm.send_message(
+                JobMessage(payload=JobPayload(type="translate", content=input_text))
+            )
+            await comm.receive_all_messages()  # Skip queuing messages
+
+        # One worker run processes all queued translations concurrently
+        await bg_worker.async_run()
+
+        results: list[str] = []
+        for _ in test_cases:
+            replies = await comm.receive_all_messages(stop_action=EVENT_ACTION_COMPLETE)
+            result = cast(JobStatusMessage, replies[0])
+            results.append(cast(str, result.payload["message"]))
+
+    assert sorted(results) == sorted(
+        f"🌍 Translated: '{input_text}' → '{expected_translation}'"
+        for input_text, expected_translation in test_cases
+    )
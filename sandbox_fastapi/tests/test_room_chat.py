@@ -37,6 +37,8 @@ async def test_room_chat_broadcast_messaging() -> None:
         app, f"/ws/room/{room_name}", consumer=RoomChatConsumer
     )
 
+    # The first join is published after the socket is accepted; let it settle
+    # before the second socket subscribes to the room group
     await first_comm.connect()
     assert await first_comm.receive_nothing()
 
@@ -49,6 +51,7 @@ async def test_room_chat_broadcast_messaging() -> None:
     notified_message = cast(RoomNotificationMessage, notified_messages[0])
     assert notified_message.payload.message == f"🚪 Someone joined room '{room_name}'"
 
+    # The joining socket must not be notified of its own join
     assert await second_comm.receive_nothing()
 
     room_message = "This is a test message"
@@ -1,7 +1,8 @@
+import asyncio
 from typing import cast
 
 import pytest
-from chanx.constants import GROUP_ACTION_COMPLETE
+from chanx.constants import EVENT_ACTION_COMPLETE, GROUP_ACTION_COMPLETE
 from chanx.fast_channels.testing import WebsocketCommunicator
 from chanx.messages.incoming import PingMessage
 from chanx.messages.outgoing import PongMessage
@@ -27,6 +28,7 @@ from sandbox_fastapi.apps.showcase.messages import (
     ReliableChatNotificationMessage,
     ReliableChatPayload,
 )
+from sandbox_fastapi.base_consumer import BaseConsumer
 from sandbox_fastapi.external_sender import (
     send_analytics_event,
     send_chat_message,
@@ -35,40 +37,34 @@ from sandbox_fastapi.external_sender import (
 )
 from sandbox_fastapi.main import app
 
+# Field-less messages shared by every ping-pong check in this module
+PING = PingMessage()
+PONG = PongMessage()
 
-@pytest.mark.asyncio
-async def test_chat_consumer_ping() -> None:
-    """Test ping-pong functionality for ChatConsumer."""
-    async with WebsocketCommunicator(app, "/ws/chat", consumer=ChatConsumer) as comm:
-        # Skip join message
-        await comm.receive_all_messages(stop_action=GROUP_ACTION_COMPLETE)
-
-        await comm.send_message(PingMessage())
-        replies = await comm.receive_all_messages()
-
-        assert len(replies) == 1
-        assert replies == [PongMessage()]
-
-
-@pytest.mark.asyncio
-async def test_chat_consumer_extra_handler_from_mixin() -> None:
-    """Test extra handler provided by ExtraWsHandlerMixin on ChatConsumer."""
-    async with WebsocketCommunicator(app, "/ws/chat", consumer=ChatConsumer) as comm:
-        # Skip join message
-        await comm.receive_all_messages(stop_action=GROUP_ACTION_COMPLETE)
 
-        await comm.send_message(ExtraRequestMessage(payload="hello"))
-        replies = await comm.receive_all_messages()
+@pytest.mark.parametrize(
+    "consumer",
+    [ChatConsumer, ReliableChatConsumer, NotificationConsumer, AnalyticsConsumer],
+)
+def test_consumer_adapters_built_at_import(consumer: type[BaseConsumer]) -> None:
+    """Validators are built at class creation, not on the first received frame."""
+    for adapter in (
+        consumer.incoming_message_adapter,
+        consumer.incoming_event_adapter,
+        consumer.outgoing_message_adapter,
+    ):
+        assert adapter is not None
+        assert adapter.pydantic_complete
 
-        assert len(replies) == 1
-        assert replies == [ExtraResponseMessage(payload="hello any extra thing")]
+    for message_cls in (ChatMessage, ReliableChatMessage, AnalyticsMessage):
+        assert message_cls.__pydantic_complete__
 
 
 @pytest.mark.asyncio
-async def test_chat_consumer_messaging() -> None:
-    """Test chat messaging and broadcasting."""
+async def test_chat_consumer() -> None:
+    """Test ping-pong, chat messaging and broadcasting on one connection."""
     async with WebsocketCommunicator(app, "/ws/chat", consumer=ChatConsumer) as comm:
-        # Skip join message
+        # Assert join message
         join_messages = await comm.receive_all_messages(
             stop_action=GROUP_ACTION_COMPLETE
         )
@@ -76,6 +72,12 @@ async def test_chat_consumer_messaging() -> None:
         join_message = cast(ChatNotificationMessage, join_messages[0])
         assert join_message.payload.message == "📢 Someone joined the chat"
 
+        await comm.send_message(PING)
+        replies = await comm.receive_all_messages()
+
+        assert len(replies) == 1
+        assert replies == [PONG]
+
         # Send chat message
         test_message = "Hello from chat!"
         await comm.send_message(ChatMessage(payload=ChatPayload(message=test_message)))
@@ -87,31 +89,22 @@ async def test_chat_consumer_messaging() -> None:
 
 
 @pytest.mark.asyncio
-async def test_reliable_chat_consumer_ping() -> None:
-    """Test ping-pong functionality for ReliableChatConsumer."""
-    async with WebsocketCommunicator(
-        app, "/ws/reliable", consumer=ReliableChatConsumer
-    ) as comm:
-        # Assert connection message
-        join_messages = await comm.receive_all_messages(
-            stop_action=GROUP_ACTION_COMPLETE
-        )
-        assert len(join_messages) == 1
-        join_message = cast(ReliableChatNotificationMessage, join_messages[0])
-        assert (
-            join_message.payload.message == "🔒 Reliable chat connection established!"
-        )
+async def test_chat_consumer_extra_handler_from_mixin() -> None:
+    """Test extra handler provided by ExtraWsHandlerMixin on ChatConsumer."""
+    async with WebsocketCommunicator(app, "/ws/chat", consumer=ChatConsumer) as comm:
+        # Skip join message
+        await comm.receive_all_messages(stop_action=GROUP_ACTION_COMPLETE)
 
-        await comm.send_message(PingMessage())
+        await comm.send_message(ExtraRequestMessage(payload="hello"))
         replies = await comm.receive_all_messages()
 
         assert len(replies) == 1
-        assert replies == [PongMessage()]
+        assert replies == [ExtraResponseMessage(payload="hello any extra thing")]
 
 
 @pytest.mark.asyncio
-async def test_reliable_chat_consumer_messaging() -> None:
-    """Test reliable chat messaging."""
+async def test_reliable_chat_consumer() -> None:
+    """Test ping-pong and reliable chat messaging on one connection."""
     async with WebsocketCommunicator(
         app, "/ws/reliable", consumer=ReliableChatConsumer
     ) as comm:
@@ -128,6 +121,12 @@ async def test_reliable_chat_consumer_messaging() -> None:
             == "🔒 Reliable chat connection established!"
         )
 
+        await comm.send_message(PING)
+        replies = await comm.receive_all_messages()
+
+        assert len(replies) == 1
+        assert replies == [PONG]
+
         # Send reliable chat message
         test_message = "Reliable message test"
         await comm.send_message(
@@ -141,24 +140,8 @@ async def test_reliable_chat_consumer_messaging() -> None:
 
 
 @pytest.mark.asyncio
-async def test_notification_consumer_ping() -> None:
-    """Test ping-pong functionality for NotificationConsumer."""
-    async with WebsocketCommunicator(
-        app, "/ws/notifications", consumer=NotificationConsumer
-    ) as comm:
-        # Skip connection notification
-        await comm.receive_all_messages(stop_action=GROUP_ACTION_COMPLETE)
-
-        await comm.send_message(PingMessage())
-        replies = await comm.receive_all_messages()
-
-        assert len(replies) == 1
-        assert replies == [PongMessage()]
-
-
-@pytest.mark.asyncio
-async def test_notification_consumer_messaging() -> None:
-    """Test notification broadcasting."""
+async def test_notification_consumer() -> None:
+    """Test ping-pong and notification broadcasting on one connection."""
     async with WebsocketCommunicator(
         app, "/ws/notifications", consumer=NotificationConsumer
     ) as comm:
@@ -171,6 +154,12 @@ async def test_notification_consumer_messaging() -> None:
         assert connection_message.payload.message == "🔔 Connected to notifications!"
         assert connection_message.payload.type == "system"
 
+        await comm.send_message(PING)
+        replies = await comm.receive_all_messages()
+
+        assert len(replies) == 1
+        assert replies == [PONG]
+
         # Send notification
         test_message = "Test notification"
         await comm.send_message(
@@ -185,24 +174,17 @@ async def test_notification_consumer_messaging() -> None:
 
 
 @pytest.mark.asyncio
-async def test_analytics_consumer_ping() -> None:
-    """Test ping-pong functionality for AnalyticsConsumer."""
+async def test_analytics_consumer() -> None:
+    """Test ping-pong and analytics event processing on one connection."""
     async with WebsocketCommunicator(
         app, "/ws/analytics", consumer=AnalyticsConsumer
     ) as comm:
-        await comm.send_message(PingMessage())
+        await comm.send_message(PING)
         replies = await comm.receive_all_messages()
 
         assert len(replies) == 1
-        assert replies == [PongMessage()]
-
+        assert replies == [PONG]
 
-@pytest.mark.asyncio
-async def test_analytics_consumer_events() -> None:
-    """Test analytics event processing."""
-    async with WebsocketCommunicator(
-        app, "/ws/analytics", consumer=AnalyticsConsumer
-    ) as comm:
         # Send analytics event
         test_event = "user_click"
         test_data = {"button": "submit", "page": "home"}
@@ -253,33 +235,43 @@ async def test_external_sender_broadcast() -> None:
     )
 
     # Connect all consumers
-    await chat_comm.connect()
-    await reliable_comm.connect()
-    await notification_comm.connect()
-    await analytics_comm.connect()
+    await asyncio.gather(
+        chat_comm.connect(),
+        reliable_comm.connect(),
+        notification_comm.connect(),
+        analytics_comm.connect(),
+    )
 
     # Clear initial connection messages
-    await chat_comm.receive_all_messages(stop_action=GROUP_ACTION_COMPLETE)
-    await reliable_comm.receive_all_messages(stop_action=GROUP_ACTION_COMPLETE)
-    await notification_comm.receive_all_messages(stop_action=GROUP_ACTION_COMPLETE)
     # Analytics doesn't send connection messages
+    await asyncio.gather(
+        chat_comm.receive_all_messages(stop_action=GROUP_ACTION_COMPLETE),
+        reliable_comm.receive_all_messages(stop_action=GROUP_ACTION_COMPLETE),
+        notification_comm.receive_all_messages(stop_action=GROUP_ACTION_COMPLETE),
+    )
 
-    # Import and call external sender functions
+    # The four senders target independent layers and groups, so run them together
+    await asyncio.gather(
+        send_chat_message(),
+        send_reliable_message(),
+        send_notification(),
+        send_analytics_event(),
+    )
+    chat_replies, reliable_replies, notification_replies, analytics_replies = (
+        await asyncio.gather(
+            chat_comm.receive_all_messages(stop_action=EVENT_ACTION_COMPLETE),
+            reliable_comm.receive_all_messages(stop_action=EVENT_ACTION_COMPLETE),
+            notification_comm.receive_all_messages(stop_action=EVENT_ACTION_COMPLETE),
+            analytics_comm.receive_all_messages(stop_action=EVENT_ACTION_COMPLETE),
+        )
+    )
 
     # Test chat message broadcast
-    await send_chat_message()
-    chat_replies = await chat_comm.receive_all_messages(
-        stop_action=GROUP_ACTION_COMPLETE
-    )
     assert len(chat_replies) == 1
     chat_reply = cast(ChatNotificationMessage, chat_replies[0])
     assert chat_reply.payload.message == "🔔 System announcement: Welcome to the chat!"
 
     # Test reliable message broadcast
-    await send_reliable_message()
-    reliable_replies = await reliable_comm.receive_all_messages(
-        stop_action=GROUP_ACTION_COMPLETE
-    )
     assert len(reliable_replies) == 1
     reliable_reply = cast(ChatNotificationMessage, reliable_replies[0])
     assert (
@@ -288,10 +280,6 @@ async def test_external_sender_broadcast() -> None:
     )
 
     # Test notification broadcast
-    await send_notification()
-    notification_replies = await notification_comm.receive_all_messages(
-        stop_action=GROUP_ACTION_COMPLETE
-    )
     assert len(notification_replies) == 1
     notification_reply = cast(NotificationBroadcastMessage, notification_replies[0])
     assert (
@@ -299,12 +287,6 @@ async def test_external_sender_broadcast() -> None:
         == "🚨 Alert: High CPU usage detected on server"
     )
 
-    # Test analytics events broadcast
-    await send_analytics_event()
-    analytics_replies = await analytics_comm.receive_all_messages(
-        stop_action=GROUP_ACTION_COMPLETE
-    )
-
     # Should receive 5 analytics events
     assert len(analytics_replies) == 5
     expected_events = [
@@ -318,7 +300,10 @@ async def test_external_sender_broadcast() -> None:
     for i, reply in enumerate(analytics_replies):
         analytics_reply = cast(AnalyticsNotificationMessage, reply)
         assert analytics_reply.payload.event == expected_events[i]
-    await chat_comm.disconnect()
-    await reliable_comm.disconnect()
-    await notification_comm.disconnect()
-    await analytics_comm.disconnect()
+
+    await asyncio.gather(
+        chat_comm.disconnect(),
+        reliable_comm.disconnect(),
+        notification_comm.disconnect(),
+        analytics_comm.disconnect(),
+    )
@@ -5,40 +5,41 @@ ARQ Worker for processing background jobs.
 Usage:
     python sandbox_fastapi/worker.py
 
-Or better, use the arq CLI directly:
+Or use the arq CLI directly:
     arq sandbox_fastapi.tasks.WorkerSettings
 
 This script starts an ARQ worker that will process jobs from Redis.
 Run this alongside your FastAPI application to handle background job processing.
 """
 
+import logging.config
 import os
-import subprocess
 import sys
 
 # Add the project root to Python path so we can import our modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from arq.logs import default_log_config  # noqa: E402
+from arq.worker import run_worker  # noqa: E402
+
+from sandbox_fastapi.tasks import WorkerSettings  # noqa: E402
+
 
 def main() -> None:
-    """Start the ARQ worker using CLI to avoid event loop issues."""
-    print("🔧 Starting ARQ worker using CLI...")
+    """Start the ARQ worker in this process, as the arq CLI does."""
+    print("🔧 Starting ARQ worker...")
     print("🔗 Connecting to Redis...")
-    print("🚀 Starting ARQ worker...")
     print("📋 Jobs will be processed as they arrive...")
     print("🛑 Press Ctrl+C to stop the worker")
 
-    # Use ARQ CLI to avoid event loop conflicts
+    # No event loop exists yet in this process, so the worker can own it
+    logging.config.dictConfig(default_log_config(verbose=False))
     try:
-        subprocess.run(
-            [sys.executable, "-m", "arq", "sandbox_fastapi.tasks.WorkerSettings"],
-            check=True,
-        )
+        # arq's settings Protocol wants cron_jobs and typed hook attributes that
+        # this plain settings class does not declare, though arq reads it fine
+        run_worker(WorkerSettings)  # type: ignore[arg-type]
     except KeyboardInterrupt:
         print("\n🛑 Worker stopped by user")
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Worker error: {e}")
-        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,67 @@
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+from chanx.client_generator.generator import ClientGenerator
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "client_generation"
+
+
+@pytest.fixture(scope="session")
+def prebuilt_client(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Generate the fixture client once per session, unformatted.
+
+    Tests copy it into their own tmp_path before modifying or regenerating it.
+    """
+    output_dir = tmp_path_factory.mktemp("prebuilt") / "client"
+    ClientGenerator(
+        schema_path=str(FIXTURES_DIR / "schema.json"),
+        output_dir=str(output_dir),
+    ).generate()
+    return output_dir
+
+
+@pytest.fixture(scope="session")
+def formatted_client(
+    tmp_path_factory: pytest.TempPathFactory, prebuilt_client: Path
+) -> Path:
+    """
+    Format a copy of the prebuilt client the way the expected output is.
+
+    ruff and black each start a fresh interpreter, so snapshot tests share
+    one formatted tree instead of formatting their own.
+    """
+    output_dir = tmp_path_factory.mktemp("formatted") / "client"
+    shutil.copytree(prebuilt_client, output_dir)
+
+    # Use ruff and black directly since scripts/lint.sh only works on repo root
+    subprocess.run(
+        ["ruff", "check", str(output_dir), "--fix"],
+        capture_output=True,
+        check=False,
+    )
+    subprocess.run(
+        ["black", str(output_dir)],
+        capture_output=True,
+        check=False,
+    )
+    return output_dir
+
+
+@pytest.fixture(scope="session")
+def minimal_schema(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Cut the fixture schema down to its chat channel for output-only tests."""
+    schema = json.loads((FIXTURES_DIR / "schema.json").read_text())
+    schema["channels"] = {"chat": schema["channels"]["chat"]}
+    schema["operations"] = {
+        name: operation
+        for name, operation in schema["operations"].items()
+        if operation["channel"]["$ref"] == "#/channels/chat"
+    }
+
+    schema_path = tmp_path_factory.mktemp("schema") / "schema.json"
+    schema_path.write_text(json.dumps(schema))
+    return schema_path
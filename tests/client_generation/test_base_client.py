@@ -84,3 +84,35 @@ def test_init_path_params_with_string() -> None:
     client = RoomClient("localhost:8000", path_params={"room_name": "lobby"})
 
     assert client.url == "ws://localhost:8000/ws/lobby"
+
+
+def test_init_path_params_missing_or_extra() -> None:
+    """Test that unknown placeholders are kept and extra params are ignored."""
+
+    class RoomClient(BaseClient):
+        path = "/ws/room/{room_id}/chat/{chat_id}"
+        incoming_message = SimpleTestMessage
+
+    client = RoomClient("localhost:8000", path_params={"room_id": 1, "other": 2})
+
+    assert client.url == "ws://localhost:8000/ws/room/1/chat/{chat_id}"
+
+
+def test_class_invariant_state_is_shared() -> None:
+    """Test that the adapter is built once per class, not per instance."""
+
+    class FirstClient(BaseClient):
+        path = "/ws/{room_name}"
+        incoming_message = SimpleTestMessage
+
+    class SecondClient(FirstClient):
+        path = "/ws/second/{room_name}"
+
+    first = FirstClient("localhost:8000", path_params={"room_name": "a"})
+    other_first = FirstClient("localhost:8000", path_params={"room_name": "b"})
+    second = SecondClient("localhost:8000", path_params={"room_name": "c"})
+
+    assert first.incoming_message_adapter is other_first.incoming_message_adapter
+    assert second.incoming_message_adapter is not first.incoming_message_adapter
+    assert other_first.url == "ws://localhost:8000/ws/b"
+    assert second.url == "ws://localhost:8000/ws/second/c"
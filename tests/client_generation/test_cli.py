@@ -1,25 +1,36 @@
 """Tests for the CLI generate-client command."""
 
+import shutil
+import subprocess
 from pathlib import Path
 from unittest import TestCase
+from unittest.mock import Mock, patch
 
 import pytest
 from chanx.cli.main import cli
-from click.testing import CliRunner
+from click.testing import CliRunner, Result
 
 
 class TestCLIGenerateClient(TestCase):
     """Test cases for the generate-client CLI command."""
 
+    # CliRunner keeps no state between invoke() calls, so one serves every test
+    runner = CliRunner()
+
     @pytest.fixture(autouse=True)
-    def setup(self, tmp_path: Path) -> None:
+    def setup(
+        self, tmp_path: Path, prebuilt_client: Path, minimal_schema: Path
+    ) -> None:
         """Set up test fixtures."""
         self.tmp_path = tmp_path
+        self.prebuilt_client = prebuilt_client
         self.fixtures_dir = (
             Path(__file__).parent.parent / "fixtures" / "client_generation"
         )
         self.schema_path = self.fixtures_dir / "schema.json"
-        self.runner = CliRunner()
+        # Tests that only check CLI output or top-level files use the small
+        # schema; the regeneration tests keep the full one
+        self.minimal_schema_path = minimal_schema
 
     def test_generate_client_basic(self) -> None:
         """Test basic client generation via CLI."""
@@ -30,7 +41,7 @@ class TestCLIGenerateClient(TestCase):
             [
                 "generate-client",
                 "--schema",
-                str(self.schema_path),
+                str(self.minimal_schema_path),
                 "--output",
                 str(output_dir),
                 "--no-format",  # Skip formatting for faster tests
@@ -51,7 +62,7 @@ class TestCLIGenerateClient(TestCase):
             [
                 "generate-client",
                 "--schema",
-                str(self.schema_path),
+                str(self.minimal_schema_path),
                 "--output",
                 str(output_dir),
                 "--no-format",
@@ -70,7 +81,7 @@ class TestCLIGenerateClient(TestCase):
             [
                 "generate-client",
                 "--schema",
-                str(self.schema_path),
+                str(self.minimal_schema_path),
                 "--output",
                 str(output_dir),
                 "--no-readme",
@@ -108,7 +119,7 @@ class TestCLIGenerateClient(TestCase):
             [
                 "generate-client",
                 "--schema",
-                str(self.schema_path),
+                str(self.minimal_schema_path),
                 "--output",
                 str(output_dir),
                 "--no-format",
@@ -173,7 +184,7 @@ class TestCLIGenerateClient(TestCase):
             [
                 "generate-client",
                 "--schema",
-                str(self.schema_path),
+                str(self.minimal_schema_path),
                 "--output",
                 str(output_dir),
                 "--formatter",
@@ -193,7 +204,7 @@ class TestCLIGenerateClient(TestCase):
             [
                 "generate-client",
                 "--schema",
-                str(self.schema_path),
+                str(self.minimal_schema_path),
                 "--output",
                 str(output_dir),
                 "--formatter",
@@ -213,19 +224,8 @@ class TestCLIGenerateClient(TestCase):
         """Test that default generation keeps base folder but clears channels."""
         output_dir = self.tmp_path / "client"
 
-        # Generate once
-        result1 = self.runner.invoke(
-            cli,
-            [
-                "generate-client",
-                "--schema",
-                str(self.schema_path),
-                "--output",
-                str(output_dir),
-                "--no-format",
-            ],
-        )
-        assert result1.exit_code == 0
+        # Start from an already generated client
+        shutil.copytree(self.prebuilt_client, output_dir)
 
         # Create a custom file in base
         base_custom = output_dir / "base" / "custom.txt"
@@ -235,8 +235,8 @@ class TestCLIGenerateClient(TestCase):
         dummy_file = output_dir / "dummy.txt"
         dummy_file.write_text("This should be removed")
 
-        # Generate again
-        result2 = self.runner.invoke(
+        # Regenerate over it
+        result = self.runner.invoke(
             cli,
             [
                 "generate-client",
@@ -247,7 +247,7 @@ class TestCLIGenerateClient(TestCase):
                 "--no-format",
             ],
         )
-        assert result2.exit_code == 0
+        assert result.exit_code == 0
 
         # Base custom file should still exist
         assert base_custom.exists()
@@ -258,26 +258,15 @@ class TestCLIGenerateClient(TestCase):
         """Test that --clear-output removes entire directory."""
         output_dir = self.tmp_path / "client"
 
-        # Generate once
-        result1 = self.runner.invoke(
-            cli,
-            [
-                "generate-client",
-                "--schema",
-                str(self.schema_path),
-                "--output",
-                str(output_dir),
-                "--no-format",
-            ],
-        )
-        assert result1.exit_code == 0
+        # Start from an already generated client
+        shutil.copytree(self.prebuilt_client, output_dir)
 
         # Create a custom file in base
         base_custom = output_dir / "base" / "custom.txt"
         base_custom.write_text("Custom base file")
 
-        # Generate again with --clear-output
-        result2 = self.runner.invoke(
+        # Regenerate over it with --clear-output
+        result = self.runner.invoke(
             cli,
             [
                 "generate-client",
@@ -289,7 +278,7 @@ class TestCLIGenerateClient(TestCase):
                 "--clear-output",
             ],
         )
-        assert result2.exit_code == 0
+        assert result.exit_code == 0
 
         # Base custom file should be removed (entire directory was cleared)
         assert not base_custom.exists()
@@ -298,27 +287,16 @@ class TestCLIGenerateClient(TestCase):
         """Test that --override-base regenerates base files."""
         output_dir = self.tmp_path / "client"
 
-        # Generate once
-        result1 = self.runner.invoke(
-            cli,
-            [
-                "generate-client",
-                "--schema",
-                str(self.schema_path),
-                "--output",
-                str(output_dir),
-                "--no-format",
-            ],
-        )
-        assert result1.exit_code == 0
+        # Start from an already generated client
+        shutil.copytree(self.prebuilt_client, output_dir)
 
         # Modify a file in base
         client_file = output_dir / "base" / "client.py"
         original_content = client_file.read_text()
         client_file.write_text("# Modified content")
 
-        # Generate again with --override-base
-        result2 = self.runner.invoke(
+        # Regenerate over it with --override-base
+        result = self.runner.invoke(
             cli,
             [
                 "generate-client",
@@ -330,7 +308,7 @@ class TestCLIGenerateClient(TestCase):
                 "--override-base",
             ],
         )
-        assert result2.exit_code == 0
+        assert result.exit_code == 0
 
         # Base client.py should be restored to original
         assert client_file.read_text() == original_content
@@ -339,26 +317,15 @@ class TestCLIGenerateClient(TestCase):
         """Test that --no-clear-channels keeps existing channel files."""
         output_dir = self.tmp_path / "client"
 
-        # Generate once
-        result1 = self.runner.invoke(
-            cli,
-            [
-                "generate-client",
-                "--schema",
-                str(self.schema_path),
-                "--output",
-                str(output_dir),
-                "--no-format",
-            ],
-        )
-        assert result1.exit_code == 0
+        # Start from an already generated client
+        shutil.copytree(self.prebuilt_client, output_dir)
 
         # Create a custom file in a channel
         channel_custom = output_dir / "chat" / "custom.txt"
         channel_custom.write_text("Custom channel file")
 
-        # Generate again with --no-clear-channels
-        result2 = self.runner.invoke(
+        # Regenerate over it with --no-clear-channels
+        result = self.runner.invoke(
             cli,
             [
                 "generate-client",
@@ -370,34 +337,32 @@ class TestCLIGenerateClient(TestCase):
                 "--no-clear-channels",
             ],
         )
-        assert result2.exit_code == 0
+        assert result.exit_code == 0
 
         # Custom channel file should still exist
         assert channel_custom.exists()
 
+    def _run_generate(self, *extra_args: str) -> Result:
+        """Generate a client from the minimal schema with extra CLI arguments."""
+        return self.runner.invoke(
+            cli,
+            [
+                "generate-client",
+                "--schema",
+                str(self.minimal_schema_path),
+                "--output",
+                str(self.tmp_path / "client"),
+                *extra_args,
+            ],
+        )
+
     def test_generate_client_formatter_timeout(self) -> None:
         """Test that formatter timeout is handled gracefully."""
-        import subprocess
-        from unittest.mock import patch
-
-        output_dir = self.tmp_path / "client"
-
-        # Patch subprocess.run to raise TimeoutExpired
-        with patch("chanx.cli.main.subprocess.run") as mock_run:
-            mock_run.side_effect = subprocess.TimeoutExpired("formatter", 30)
-
-            result = self.runner.invoke(
-                cli,
-                [
-                    "generate-client",
-                    "--schema",
-                    str(self.schema_path),
-                    "--output",
-                    str(output_dir),
-                    "--formatter",
-                    "slow_formatter",
-                ],
-            )
+        with patch(
+            "chanx.cli.main.subprocess.run",
+            side_effect=subprocess.TimeoutExpired("formatter", 30),
+        ):
+            result = self._run_generate("--formatter", "slow_formatter")
 
         # Should still succeed despite formatter timeout
         assert result.exit_code == 0
@@ -405,26 +370,11 @@ class TestCLIGenerateClient(TestCase):
 
     def test_generate_client_formatter_error(self) -> None:
         """Test that formatter errors are handled gracefully."""
-        from unittest.mock import patch
-
-        output_dir = self.tmp_path / "client"
-
-        # Patch subprocess.run to raise an exception
-        with patch("chanx.cli.main.subprocess.run") as mock_run:
-            mock_run.side_effect = Exception("Unexpected error")
-
-            result = self.runner.invoke(
-                cli,
-                [
-                    "generate-client",
-                    "--schema",
-                    str(self.schema_path),
-                    "--output",
-                    str(output_dir),
-                    "--formatter",
-                    "error_formatter",
-                ],
-            )
+        with patch(
+            "chanx.cli.main.subprocess.run",
+            side_effect=Exception("Unexpected error"),
+        ):
+            result = self._run_generate("--formatter", "error_formatter")
 
         # Should still succeed despite formatter error
         assert result.exit_code == 0
@@ -432,82 +382,30 @@ class TestCLIGenerateClient(TestCase):
 
     def test_generate_client_formatter_warning(self) -> None:
         """Test that formatter warnings are displayed."""
-        from unittest.mock import Mock, patch
-
-        output_dir = self.tmp_path / "client"
-
-        # Patch subprocess.run to return non-zero exit code
-        with patch("chanx.cli.main.subprocess.run") as mock_run:
-            mock_result = Mock()
-            mock_result.returncode = 1
-            mock_result.stderr = "Warning: some files not formatted"
-            mock_run.return_value = mock_result
-
-            result = self.runner.invoke(
-                cli,
-                [
-                    "generate-client",
-                    "--schema",
-                    str(self.schema_path),
-                    "--output",
-                    str(output_dir),
-                    "--formatter",
-                    "warning_formatter",
-                ],
-            )
+        with patch(
+            "chanx.cli.main.subprocess.run",
+            return_value=Mock(returncode=1, stderr="Warning: some files not formatted"),
+        ):
+            result = self._run_generate("--formatter", "warning_formatter")
 
         assert result.exit_code == 0
         assert "Formatter warning" in result.output
 
     def test_generate_client_auto_detect_ruff(self) -> None:
         """Test that ruff is auto-detected when no formatter is specified."""
-        from unittest.mock import Mock, patch
-
-        output_dir = self.tmp_path / "client"
-
-        # Mock shutil.which to find ruff
-        with patch("chanx.cli.main.shutil.which") as mock_which:
-            mock_which.return_value = "/usr/bin/ruff"
-
-            with patch("chanx.cli.main.subprocess.run") as mock_run:
-                mock_result = Mock()
-                mock_result.returncode = 0
-                mock_run.return_value = mock_result
-
-                result = self.runner.invoke(
-                    cli,
-                    [
-                        "generate-client",
-                        "--schema",
-                        str(self.schema_path),
-                        "--output",
-                        str(output_dir),
-                    ],
-                )
+        with (
+            patch("chanx.cli.main.shutil.which", return_value="/usr/bin/ruff"),
+            patch("chanx.cli.main.subprocess.run", return_value=Mock(returncode=0)),
+        ):
+            result = self._run_generate()
 
         assert result.exit_code == 0
         assert "ruff format" in result.output
 
     def test_generate_client_no_formatter_available(self) -> None:
         """Test generation when no formatter is available."""
-        from unittest.mock import patch
-
-        output_dir = self.tmp_path / "client"
-
-        # Mock shutil.which to not find any formatter
-        with patch("chanx.cli.main.shutil.which") as mock_which:
-            mock_which.return_value = None
-
-            result = self.runner.invoke(
-                cli,
-                [
-                    "generate-client",
-                    "--schema",
-                    str(self.schema_path),
-                    "--output",
-                    str(output_dir),
-                ],
-            )
+        with patch("chanx.cli.main.shutil.which", return_value=None):
+            result = self._run_generate()
 
         assert result.exit_code == 0
         # Should not attempt formatting
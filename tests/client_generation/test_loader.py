@@ -1,13 +1,26 @@
 """Tests for SchemaLoader."""
 
+import math
+import sys
 from pathlib import Path
+from typing import Any
 from unittest import TestCase
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from chanx.client_generator.loader import SchemaLoader
 
 
+def _mock_httpx(text: str, headers: dict[str, str]) -> MagicMock:
+    """Build a stand-in httpx module whose get() returns the given body."""
+    mock_httpx = MagicMock()
+    mock_response = Mock()
+    mock_response.text = text
+    mock_response.headers = headers
+    mock_httpx.get.return_value = mock_response
+    return mock_httpx
+
+
 class TestSchemaLoader(TestCase):
     """Test cases for SchemaLoader."""
 
@@ -81,6 +94,26 @@ info:
         with pytest.raises(ValueError, match="Schema must be a JSON object"):
             SchemaLoader.load(str(schema_file))
 
+    def test_load_json_without_orjson(self) -> None:
+        """Test that JSON loads with the stdlib parser when orjson is missing."""
+        schema_file = self.tmp_path / "schema.json"
+        schema_file.write_text('{"asyncapi": "3.0.0"}')
+
+        with patch("chanx.client_generator.loader.orjson", None):
+            result = SchemaLoader.load(str(schema_file))
+
+        assert result == {"asyncapi": "3.0.0"}
+
+    def test_load_json_rejected_by_orjson(self) -> None:
+        """Test that NaN and integers beyond 64 bits still load as they did."""
+        schema_file = self.tmp_path / "schema.json"
+        schema_file.write_text('{"minimum": NaN, "maximum": 18446744073709551616}')
+
+        result = SchemaLoader.load(str(schema_file))
+
+        assert math.isnan(result["minimum"])
+        assert result["maximum"] == 2**64
+
     def test_load_yaml_array_not_object(self) -> None:
         """Test that ValueError is raised for YAML array instead of object."""
         schema_file = self.tmp_path / "array.yaml"
@@ -129,6 +162,11 @@ info:
         assert SchemaLoader._is_url("schema.json") is False
         assert SchemaLoader._is_url("./schema.json") is False
 
+    def test_is_url_other_scheme(self) -> None:
+        """Test that only HTTP(S) URLs are fetched remotely."""
+        assert SchemaLoader._is_url("ftp://example.com/schema.json") is False
+        assert SchemaLoader._is_url("HTTPS://example.com/schema.json") is True
+
     def test_is_url_malformed(self) -> None:
         """Test URL detection for malformed strings."""
         assert SchemaLoader._is_url("not a url") is False
@@ -136,15 +174,10 @@ info:
 
     def test_load_from_url_json(self) -> None:
         """Test loading schema from URL with JSON content."""
-        import sys
-        from unittest.mock import MagicMock
-
-        # Mock httpx module
-        mock_httpx = MagicMock()
-        mock_response = Mock()
-        mock_response.text = '{"asyncapi": "3.0.0", "info": {"title": "Test"}}'
-        mock_response.headers = {"content-type": "application/json"}
-        mock_httpx.get.return_value = mock_response
+        mock_httpx = _mock_httpx(
+            '{"asyncapi": "3.0.0", "info": {"title": "Test"}}',
+            {"content-type": "application/json"},
+        )
 
         with patch.dict(sys.modules, {"httpx": mock_httpx}):
             result = SchemaLoader.load("https://example.com/schema.json")
@@ -157,14 +190,10 @@ info:
 
     def test_load_from_url_yaml(self) -> None:
         """Test loading schema from URL with YAML content."""
-        import sys
-        from unittest.mock import MagicMock
-
-        mock_httpx = MagicMock()
-        mock_response = Mock()
-        mock_response.text = "asyncapi: '3.0.0'\ninfo:\n  title: Test\n"
-        mock_response.headers = {"content-type": "application/x-yaml"}
-        mock_httpx.get.return_value = mock_response
+        mock_httpx = _mock_httpx(
+            "asyncapi: '3.0.0'\ninfo:\n  title: Test\n",
+            {"content-type": "application/x-yaml"},
+        )
 
         with patch.dict(sys.modules, {"httpx": mock_httpx}):
             result = SchemaLoader.load("https://example.com/schema.yaml")
@@ -173,14 +202,7 @@ info:
 
     def test_load_from_url_json_by_extension(self) -> None:
         """Test loading JSON from URL based on file extension."""
-        import sys
-        from unittest.mock import MagicMock
-
-        mock_httpx = MagicMock()
-        mock_response = Mock()
-        mock_response.text = '{"asyncapi": "3.0.0"}'
-        mock_response.headers = {}  # No content-type
-        mock_httpx.get.return_value = mock_response
+        mock_httpx = _mock_httpx('{"asyncapi": "3.0.0"}', {})  # No content-type
 
         with patch.dict(sys.modules, {"httpx": mock_httpx}):
             result = SchemaLoader.load("https://example.com/schema.json")
@@ -189,14 +211,7 @@ info:
 
     def test_load_from_url_yaml_by_extension(self) -> None:
         """Test loading YAML from URL based on file extension."""
-        import sys
-        from unittest.mock import MagicMock
-
-        mock_httpx = MagicMock()
-        mock_response = Mock()
-        mock_response.text = "asyncapi: '3.0.0'\n"
-        mock_response.headers = {}  # No content-type
-        mock_httpx.get.return_value = mock_response
+        mock_httpx = _mock_httpx("asyncapi: '3.0.0'\n", {})  # No content-type
 
         with patch.dict(sys.modules, {"httpx": mock_httpx}):
             result = SchemaLoader.load("https://example.com/schema.yml")
@@ -205,14 +220,7 @@ info:
 
     def test_load_from_url_auto_detect(self) -> None:
         """Test auto-detection when loading from URL without content-type or extension."""
-        import sys
-        from unittest.mock import MagicMock
-
-        mock_httpx = MagicMock()
-        mock_response = Mock()
-        mock_response.text = '{"asyncapi": "3.0.0"}'
-        mock_response.headers = {}
-        mock_httpx.get.return_value = mock_response
+        mock_httpx = _mock_httpx('{"asyncapi": "3.0.0"}', {})
 
         with patch.dict(sys.modules, {"httpx": mock_httpx}):
             result = SchemaLoader.load("https://example.com/api/schema")
@@ -221,9 +229,6 @@ info:
 
     def test_load_from_url_http_error(self) -> None:
         """Test that HTTPStatusError is converted to ValueError."""
-        import sys
-        from typing import Any
-        from unittest.mock import MagicMock
 
         # Create mock exception classes that inherit from BaseException
         class MockHTTPStatusError(BaseException):
@@ -251,8 +256,6 @@ info:
 
     def test_load_from_url_request_error(self) -> None:
         """Test that RequestError is converted to ValueError."""
-        import sys
-        from unittest.mock import MagicMock
 
         # Create proper exception classes that inherit from BaseException
         class MockRequestError(BaseException):
@@ -272,20 +275,9 @@ info:
 
     def test_load_from_url_httpx_not_installed(self) -> None:
         """Test that helpful error is raised when httpx is not installed."""
-        import sys
-
-        # Simulate httpx not being installed
+        # Simulate httpx not being installed; the loader imports it lazily
         with patch.dict(sys.modules, {"httpx": None}):
-            # Clear any cached imports
-            import importlib
-
-            import chanx.client_generator.loader
-
-            importlib.reload(chanx.client_generator.loader)
-
             with pytest.raises(
                 ValueError, match="httpx is required to load schemas from URLs"
             ):
-                chanx.client_generator.loader.SchemaLoader.load(
-                    "https://example.com/schema.json"
-                )
+                SchemaLoader.load("https://example.com/schema.json")
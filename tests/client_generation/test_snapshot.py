@@ -4,52 +4,28 @@ These tests ensure that the generated client code matches the expected output
 exactly. This helps catch unintended changes in code generation.
 """
 
-import subprocess
 from pathlib import Path
 from unittest import TestCase
 
 import pytest
-from chanx.client_generator.generator import ClientGenerator
 
 
 class TestGeneratedClientSnapshot(TestCase):
     """Snapshot tests for generated client code."""
 
     @pytest.fixture(autouse=True)
-    def setup(self, tmp_path: Path) -> None:
+    def setup(self, formatted_client: Path) -> None:
         """Set up test fixtures."""
-        self.tmp_path = tmp_path
+        self.formatted_client = formatted_client
         self.fixtures_dir = (
             Path(__file__).parent.parent / "fixtures" / "client_generation"
         )
         self.schema_path = self.fixtures_dir / "schema.json"
         self.expected_output_dir = self.fixtures_dir / "expected_output"
 
-    def _generate_and_format(self, output_dir: Path) -> None:
-        """Generate client code and format it."""
-        generator = ClientGenerator(
-            schema_path=str(self.schema_path),
-            output_dir=str(output_dir),
-        )
-        generator.generate()
-
-        # Format the output to match expected output (which is formatted)
-        # Use ruff and black directly since scripts/lint.sh only works on repo root
-        subprocess.run(
-            ["ruff", "check", str(output_dir), "--fix"],
-            capture_output=True,
-            check=False,
-        )
-        subprocess.run(
-            ["black", str(output_dir)],
-            capture_output=True,
-            check=False,
-        )
-
     def test_chat_client_snapshot(self) -> None:
         """Test that generated chat client matches expected output."""
-        output_dir = self.tmp_path / "output"
-        self._generate_and_format(output_dir)
+        output_dir = self.formatted_client
 
         # Compare chat client
         generated_file = output_dir / "chat" / "client.py"
@@ -65,8 +41,7 @@ class TestGeneratedClientSnapshot(TestCase):
 
     def test_chat_messages_snapshot(self) -> None:
         """Test that generated chat messages match expected output."""
-        output_dir = self.tmp_path / "output"
-        self._generate_and_format(output_dir)
+        output_dir = self.formatted_client
 
         # Compare chat messages
         generated_file = output_dir / "chat" / "messages.py"
@@ -82,8 +57,7 @@ class TestGeneratedClientSnapshot(TestCase):
 
     def test_shared_messages_snapshot(self) -> None:
         """Test that generated shared messages match expected output."""
-        output_dir = self.tmp_path / "output"
-        self._generate_and_format(output_dir)
+        output_dir = self.formatted_client
 
         # Compare shared messages
         generated_file = output_dir / "shared" / "messages.py"
@@ -99,8 +73,7 @@ class TestGeneratedClientSnapshot(TestCase):
 
     def test_package_init_snapshot(self) -> None:
         """Test that generated package __init__.py matches expected output."""
-        output_dir = self.tmp_path / "output"
-        self._generate_and_format(output_dir)
+        output_dir = self.formatted_client
 
         # Compare package init
         generated_file = output_dir / "__init__.py"
@@ -118,8 +91,7 @@ class TestGeneratedClientSnapshot(TestCase):
 
     def test_room_chat_client_with_parameters_snapshot(self) -> None:
         """Test that generated room_chat client with path parameters matches expected output."""
-        output_dir = self.tmp_path / "output"
-        self._generate_and_format(output_dir)
+        output_dir = self.formatted_client
 
         # Compare room_chat client (has path parameters)
         generated_file = output_dir / "room_chat" / "client.py"
@@ -137,8 +109,7 @@ class TestGeneratedClientSnapshot(TestCase):
 
     def test_all_channel_files_snapshot(self) -> None:
         """Test that all channel files match expected output."""
-        output_dir = self.tmp_path / "output"
-        self._generate_and_format(output_dir)
+        output_dir = self.formatted_client
 
         channels = [
             "chat",
@@ -197,8 +168,7 @@ class TestGeneratedClientSnapshot(TestCase):
 
     def test_base_client_snapshot(self) -> None:
         """Test that base client files match expected output."""
-        output_dir = self.tmp_path / "output"
-        self._generate_and_format(output_dir)
+        output_dir = self.formatted_client
 
         # Compare base client
         generated_file = output_dir / "base" / "client.py"
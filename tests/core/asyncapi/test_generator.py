@@ -4,9 +4,11 @@ Tests for chanx.asyncapi.generator module.
 Tests the AsyncAPI 3.0 specification generator functionality.
 """
 
+import json
 from typing import Any, Literal
 from unittest.mock import Mock
 
+import pytest
 from chanx.asyncapi.generator import AsyncAPIGenerator
 from chanx.channels.websocket import AsyncJsonWebsocketConsumer
 from chanx.core.decorators import channel, event_handler, ws_handler
@@ -14,6 +16,9 @@ from chanx.messages.base import BaseMessage
 from chanx.routing.discovery import RouteInfo
 from pydantic import BaseModel
 
+# The generator never calls route handlers, so all routes can share one
+HANDLER = Mock()
+
 
 class DummyMessage(BaseMessage):
     action: Literal["test"] = "test"
@@ -115,7 +120,7 @@ class TestAsyncAPIGenerator:
         """Test generating spec with single route."""
         route = RouteInfo(
             path="/ws/test",
-            handler=Mock(),
+            handler=HANDLER,
             base_url="ws://localhost:8000",
             consumer=DummyConsumer,
         )
@@ -136,13 +141,13 @@ class TestAsyncAPIGenerator:
         routes = [
             RouteInfo(
                 path="/ws/test1",
-                handler=Mock(),
+                handler=HANDLER,
                 base_url="ws://localhost:8000",
                 consumer=DummyConsumer,
             ),
             RouteInfo(
                 path="/ws/test2",
-                handler=Mock(),
+                handler=HANDLER,
                 base_url="ws://localhost:8000",
                 consumer=UndocumentedConsumer,
             ),
@@ -157,31 +162,22 @@ class TestAsyncAPIGenerator:
         # Each route should generate operations
         assert len(spec["operations"]) > 0
 
-    def test_server_environment_name_localhost(self) -> None:
-        """Test server environment name generation for localhost."""
-        generator = AsyncAPIGenerator([], server_url="ws://localhost:8000")
-        env_name = generator._get_server_environment_name()
-        assert env_name == "development"
-
-        generator = AsyncAPIGenerator([], server_url="ws://127.0.0.1:9000")
-        env_name = generator._get_server_environment_name()
-        assert env_name == "development"
-
-    def test_server_environment_name_production(self) -> None:
-        """Test server environment name generation for production."""
-        generator = AsyncAPIGenerator([], server_url="wss://production.example.com:443")
-        env_name = generator._get_server_environment_name()
-        assert env_name == "production"
-
-        generator = AsyncAPIGenerator([], server_url="wss://api.mysite.com")
-        env_name = generator._get_server_environment_name()
-        assert env_name == "production"
-
-    def test_server_environment_name_no_url(self) -> None:
-        """Test server environment name when no URL is provided."""
-        generator = AsyncAPIGenerator([], server_url=None)
-        env_name = generator._get_server_environment_name()
-        assert env_name == "development"
+    @pytest.mark.parametrize(
+        ("server_url", "expected"),
+        [
+            ("ws://localhost:8000", "development"),
+            ("ws://127.0.0.1:9000", "development"),
+            ("wss://production.example.com:443", "production"),
+            ("wss://api.mysite.com", "production"),
+            (None, "development"),
+        ],
+    )
+    def test_server_environment_name(
+        self, server_url: str | None, expected: str
+    ) -> None:
+        """Test server environment name is derived from the server URL."""
+        generator = AsyncAPIGenerator([], server_url=server_url)
+        assert generator._get_server_environment_name() == expected
 
     def test_parameter_type_description(self) -> None:
         """Test parameter type description generation."""
@@ -203,7 +199,7 @@ class TestAsyncAPIGenerator:
         # First need to register the consumer's messages
         route = RouteInfo(
             path="/ws/test",
-            handler=Mock(),
+            handler=HANDLER,
             base_url="ws://localhost:8000",
             consumer=DummyConsumer,
         )
@@ -232,7 +228,7 @@ class TestAsyncAPIGenerator:
         """Test channel building with @channel decorator metadata."""
         route = RouteInfo(
             path="/ws/test",
-            handler=Mock(),
+            handler=HANDLER,
             base_url="ws://localhost:8000",
             consumer=DummyConsumer,
         )
@@ -250,7 +246,7 @@ class TestAsyncAPIGenerator:
         """Test building channels with route information."""
         route = RouteInfo(
             path="/ws/test/{user_id}",
-            handler=Mock(),
+            handler=HANDLER,
             base_url="ws://localhost:8000",
             path_params={"user_id": "int"},
             consumer=DummyConsumer,
@@ -275,7 +271,7 @@ class TestAsyncAPIGenerator:
         """Test building operations from consumer handlers."""
         route = RouteInfo(
             path="/ws/test",
-            handler=Mock(),
+            handler=HANDLER,
             base_url="ws://localhost:8000",
             consumer=DummyConsumer,
         )
@@ -298,7 +294,7 @@ class TestAsyncAPIGenerator:
         """Test channel creation with path parameters."""
         route = RouteInfo(
             path="/ws/room/{room_id}/user/{user_id}",
-            handler=Mock(),
+            handler=HANDLER,
             base_url="ws://localhost:8000",
             path_params={"room_id": "str", "user_id": "int"},
             consumer=DummyConsumer,
@@ -322,7 +318,7 @@ class TestAsyncAPIGenerator:
         """Test channel creation without @channel decorator."""
         route = RouteInfo(
             path="/ws/simple",
-            handler=Mock(),
+            handler=HANDLER,
             base_url="ws://localhost:8000",
             consumer=UndocumentedConsumer,
         )
@@ -339,7 +335,7 @@ class TestAsyncAPIGenerator:
         """Test operation structure and content."""
         route = RouteInfo(
             path="/ws/test",
-            handler=Mock(),
+            handler=HANDLER,
             base_url="ws://localhost:8000",
             consumer=DummyConsumer,
         )
@@ -371,7 +367,7 @@ class TestAsyncAPIGenerator:
 
         route = RouteInfo(
             path="/ws/tagged",
-            handler=Mock(),
+            handler=HANDLER,
             base_url="ws://localhost:8000",
             consumer=TaggedConsumer,
         )
@@ -381,12 +377,11 @@ class TestAsyncAPIGenerator:
         generator.build_operations()
 
         # Should have operation with tags
-        operations = list(generator.operations.values())
-        assert len(operations) > 0
+        assert len(generator.operations) > 0
 
         # Find operation with tags
         tagged_operation = None
-        for op in operations:
+        for op in generator.operations.values():
             if "tags" in op:
                 tagged_operation = op
                 break
@@ -411,7 +406,7 @@ class TestAsyncAPIGenerator:
 
         route = RouteInfo(
             path="/ws/union",
-            handler=Mock(),
+            handler=HANDLER,
             base_url="ws://localhost:8000",
             consumer=UnionConsumer,
         )
@@ -447,7 +442,7 @@ class TestAsyncAPIGenerator:
 
         route = RouteInfo(
             path="/ws/list",
-            handler=Mock(),
+            handler=HANDLER,
             base_url="ws://localhost:8000",
             consumer=ListConsumer,
         )
@@ -483,7 +478,7 @@ class TestAsyncAPIGenerator:
 
         route = RouteInfo(
             path="/ws/tuple",
-            handler=Mock(),
+            handler=HANDLER,
             base_url="ws://localhost:8000",
             consumer=TupleConsumer,
         )
@@ -519,7 +514,7 @@ class TestAsyncAPIGenerator:
 
         route = RouteInfo(
             path="/ws/event_list",
-            handler=Mock(),
+            handler=HANDLER,
             base_url="ws://localhost:8000",
             consumer=EventConsumerWithList,
         )
@@ -556,7 +551,7 @@ class TestAsyncAPIGenerator:
 
         route = RouteInfo(
             path="/ws/test",
-            handler=Mock(),
+            handler=HANDLER,
             base_url="ws://localhost:8000",
             consumer=DefaultConsumer,
         )
@@ -596,7 +591,7 @@ class TestAsyncAPIGenerator:
 
         route = RouteInfo(
             path="/ws/user_registration",
-            handler=Mock(),
+            handler=HANDLER,
             base_url="ws://localhost:8000",
             consumer=UserRegistrationConsumer,
         )
@@ -619,10 +614,10 @@ class TestAsyncAPIGenerator:
         assert all("_" not in key for key in spec["components"]["messages"].keys())
 
         # Schema keys should be preserved (class names in PascalCase)
-        schema_keys = list(spec["components"]["schemas"].keys())
-        assert "UserPayload" in schema_keys
-        assert "UserRegistrationMessage" in schema_keys
-        assert "RegistrationCompleteMessage" in schema_keys
+        schemas = spec["components"]["schemas"]
+        assert "UserPayload" in schemas
+        assert "UserRegistrationMessage" in schemas
+        assert "RegistrationCompleteMessage" in schemas
 
         # Schema properties camelized
         for schema in spec["components"]["schemas"].values():
@@ -669,7 +664,7 @@ class TestAsyncAPIGeneratorIntegration:
         """Test full spec generation with well-documented consumer."""
         route = RouteInfo(
             path="/ws/chat/{room_id}",
-            handler=Mock(),
+            handler=HANDLER,
             base_url="wss://api.example.com",
             path_params={"room_id": "str"},
             consumer=DummyConsumer,
@@ -732,13 +727,13 @@ class TestAsyncAPIGeneratorIntegration:
         routes = [
             RouteInfo(
                 path="/ws/chat",
-                handler=Mock(),
+                handler=HANDLER,
                 base_url="ws://localhost:8000",
                 consumer=ChatConsumer,
             ),
             RouteInfo(
                 path="/ws/notifications",
-                handler=Mock(),
+                handler=HANDLER,
                 base_url="ws://localhost:8000",
                 consumer=NotificationConsumer,
             ),
@@ -754,9 +749,8 @@ class TestAsyncAPIGeneratorIntegration:
         assert len(spec["operations"]) > 0
 
         # Channel names should reflect the @channel decorator names
-        channel_names = list(spec["channels"].keys())
-        assert "chat" in channel_names
-        assert "notifications" in channel_names
+        assert "chat" in spec["channels"]
+        assert "notifications" in spec["channels"]
 
     def test_generation_with_event_handlers(self) -> None:
         """Test generation including event handlers."""
@@ -776,7 +770,7 @@ class TestAsyncAPIGeneratorIntegration:
 
         route = RouteInfo(
             path="/ws/events",
-            handler=Mock(),
+            handler=HANDLER,
             base_url="ws://localhost:8000",
             consumer=EventConsumer,
         )
@@ -784,20 +778,14 @@ class TestAsyncAPIGeneratorIntegration:
         generator = AsyncAPIGenerator([route])
         spec = generator.generate()
 
-        # Should have operations for both ws_handler and event_handler
-        operations = spec["operations"]
-        operation_names = list(operations.keys())
-
         # Should have both send/receive for ws_handler and operations for event_handler
-        assert len(operation_names) > 0
+        assert len(spec["operations"]) > 0
 
     def test_spec_serialization(self) -> None:
         """Test that generated spec can be JSON serialized."""
-        import json
-
         route = RouteInfo(
             path="/ws/test",
-            handler=Mock(),
+            handler=HANDLER,
             base_url="ws://localhost:8000",
             consumer=DummyConsumer,
         )
@@ -808,10 +796,7 @@ class TestAsyncAPIGeneratorIntegration:
         # Should be JSON serializable without errors
         json_str = json.dumps(spec)
         assert isinstance(json_str, str)
-
-        # Should be able to deserialize back
-        deserialized = json.loads(json_str)
-        assert deserialized["asyncapi"] == "3.0.0"
+        assert spec["asyncapi"] == "3.0.0"
 
 
 class TestAsyncAPIGeneratorErrorHandling:
@@ -827,7 +812,7 @@ class TestAsyncAPIGeneratorErrorHandling:
 
         route = RouteInfo(
             path="/ws/test",
-            handler=Mock(),
+            handler=HANDLER,
             base_url="ws://localhost:8000",
             consumer=EmptyConsumer,
         )
@@ -854,7 +839,7 @@ class TestAsyncAPIGeneratorErrorHandling:
 
         route = RouteInfo(
             path="/ws/minimal",
-            handler=Mock(),
+            handler=HANDLER,
             base_url="ws://localhost:8000",
             consumer=MinimalConsumer,
         )
@@ -5,6 +5,7 @@ This module tests the broadcast event capture functionality, which is similar to
 structlog's capture_logs() for testing broadcast_event() calls.
 """
 
+from collections.abc import Iterator
 from typing import Any, Literal
 from unittest.mock import AsyncMock, Mock
 
@@ -53,17 +54,27 @@ class DummyConsumer(AsyncJsonWebsocketConsumer):
         pass
 
 
+# Mock channel layer shared by every test; it is reset before each one
+MOCK_LAYER = Mock()
+MOCK_LAYER.group_send = AsyncMock()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_channel_layer() -> Iterator[Mock]:
+    """Make DummyConsumer use MOCK_LAYER for this module, restoring it afterwards."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(DummyConsumer, "get_channel_layer", lambda alias: MOCK_LAYER)
+        yield MOCK_LAYER
+
+
 class TestCaptureBroadcastEvents:
     """Test capture_broadcast_events functionality."""
 
     @pytest.fixture(autouse=True)
     def setup_method(self) -> None:
-        """Set up mock channel layer before each test."""
-        self.mock_layer = Mock()
-        self.mock_layer.group_send = AsyncMock()
-
-        # Replace get_channel_layer on the class with a function that returns mock_layer
-        DummyConsumer.get_channel_layer = lambda alias: self.mock_layer  # type: ignore[misc, assignment]
+        """Reset the shared mock channel layer before each test."""
+        self.mock_layer = MOCK_LAYER
+        self.mock_layer.group_send.reset_mock(return_value=True, side_effect=True)
 
     @pytest.mark.asyncio
     async def test_capture_single_event(self) -> None:
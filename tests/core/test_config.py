@@ -4,16 +4,22 @@ Tests for chanx.core.config module.
 Tests the configuration system that's framework-agnostic.
 """
 
+from typing import Any
+
+import pytest
 from chanx.core.config import Config
 
 
 class TestConfig:
     """Test the core configuration class."""
 
-    def test_default_values(self) -> None:
-        """Test that default configuration values are set correctly."""
-        config = Config()
+    @pytest.fixture(scope="class")
+    def config(self) -> Config:
+        """Config instance shared by every test in the class."""
+        return Config()
 
+    def test_default_values(self, config: Config) -> None:
+        """Test that default configuration values are set correctly."""
         # Note: send_completion may be True if Django settings are loaded
         assert config.send_completion in [True, False]
         assert config.send_message_immediately is True
@@ -21,37 +27,22 @@ class TestConfig:
         assert config.log_ignored_actions == {}
         assert config.camelize is False
 
-    def test_config_attribute_access(self) -> None:
-        """Test that config attributes can be accessed."""
-        config = Config()
-
-        # Test all default attributes
-        attributes = [
-            "send_completion",
-            "send_message_immediately",
-            "log_websocket_message",
-            "log_ignored_actions",
-            "camelize",
-        ]
-
-        for attr in attributes:
-            assert hasattr(config, attr)
-            # Should not raise an exception
-            getattr(config, attr)
-
-    def test_config_boolean_attributes(self) -> None:
-        """Test that boolean config attributes are actually booleans."""
-        config = Config()
-
-        boolean_attrs = [
-            "send_completion",
-            "send_message_immediately",
-            "log_websocket_message",
-            "camelize",
-        ]
-
-        for attr in boolean_attrs:
-            value = getattr(config, attr)
-            assert isinstance(
-                value, bool
-            ), f"{attr} should be boolean, got {type(value)}"
+    @pytest.mark.parametrize(
+        ("attr", "expected_type"),
+        [
+            ("send_completion", bool),
+            ("send_message_immediately", bool),
+            ("log_websocket_message", bool),
+            ("log_ignored_actions", dict),
+            ("camelize", bool),
+        ],
+    )
+    def test_config_attribute_types(
+        self, config: Config, attr: str, expected_type: type[Any]
+    ) -> None:
+        """Test that config attributes can be accessed and have the right type."""
+        # A missing attribute raises AttributeError here and fails the test
+        value = getattr(config, attr)
+        assert isinstance(
+            value, expected_type
+        ), f"{attr} should be {expected_type.__name__}, got {type(value)}"
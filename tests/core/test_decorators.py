@@ -87,6 +87,19 @@ class TestWsHandler:
         assert handler_info["input_type"] == DummyMessage
         assert handler_info["output_type"] == DummyResponse
 
+    def test_ws_handler_explicit_types_skip_annotation_resolution(self) -> None:
+        """Test that explicit types do not require resolvable annotations."""
+
+        @ws_handler(input_type=DummyMessage, output_type=DummyResponse)
+        async def handle_unresolved(
+            _self: Any, _message: "UndefinedMessage"  # type: ignore[name-defined] # noqa: F821
+        ) -> None:
+            pass
+
+        handler_info = getattr(handle_unresolved, "_ws_handler_info")
+        assert handler_info["input_type"] == DummyMessage
+        assert handler_info["output_type"] == DummyResponse
+
     def test_ws_handler_with_asyncapi_metadata(self) -> None:
         """Test ws_handler decorator with AsyncAPI documentation metadata."""
 
@@ -1,6 +1,6 @@
 # pyright: reportUnusedClass=false
 
-from typing import Any, Literal
+from typing import Annotated, Any, Literal
 from unittest import TestCase
 
 import pytest
@@ -9,6 +9,7 @@ import pytest
 from chanx.messages.base import (
     BaseMessage,
 )
+from pydantic import Field
 
 
 class TestBaseMessage(TestCase):
@@ -54,6 +55,25 @@ class TestBaseMessage(TestCase):
             class InvalidMessage(BaseMessage):
                 action: str
 
+    def test_non_literal_string_action_field(self) -> None:
+        """Test that a postponed non-Literal 'action' annotation is rejected."""
+        with pytest.raises(
+            TypeError, match=r"requires the field 'action' to be a `Literal` type"
+        ):
+
+            class InvalidMessage(BaseMessage):
+                action: "str"
+
+    def test_annotated_literal_action_field(self) -> None:
+        """Test that an Annotated Literal 'action' field is accepted."""
+
+        class AnnotatedMessage(BaseMessage):
+            action: Annotated[Literal["annotated"], Field(description="Action")] = (
+                "annotated"
+            )
+
+        assert AnnotatedMessage(payload=None).action == "annotated"
+
     def test_inheritance(self) -> None:
         """Test that inheritance works correctly for BaseMessage."""
 
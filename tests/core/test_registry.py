@@ -5,11 +5,15 @@ Tests the message registry functionality.
 """
 
 import json
+from collections.abc import Callable
 from typing import Any, Literal
+from unittest.mock import patch
 
+import pytest
 from chanx.core.registry import MessageRegistry
 from chanx.messages.base import BaseMessage
 from pydantic import BaseModel
+from pydantic.errors import PydanticInvalidForJsonSchema
 from typing_extensions import TypedDict
 
 
@@ -44,6 +48,11 @@ class RefDummyMessage(BaseMessage):
     payload: Payload
 
 
+class CallableMessage(BaseMessage):
+    action: Literal["callable"] = "callable"
+    payload: Callable[[], None]
+
+
 class TestMessageRegistry:
     """Test the MessageRegistry class."""
 
@@ -380,3 +389,36 @@ class TestMessageRegistry:
         # Both should be in the consumer messages
         assert DummyMessage in registry.consumer_messages["TestConsumer"]
         assert OtherDummyMessage in registry.consumer_messages["TestConsumer"]
+
+    def test_add_defers_schema_building(self) -> None:
+        """Test that schemas are built on first read, in the order types were added."""
+        registry = MessageRegistry()
+
+        with patch.object(
+            DummyMessage, "model_json_schema", wraps=DummyMessage.model_json_schema
+        ) as mock_schema:
+            registry.add(DummyMessage, "TestConsumer")
+            registry.add(OtherDummyMessage, "TestConsumer")
+            mock_schema.assert_not_called()
+
+            assert list(registry.messages) == [DummyMessage, OtherDummyMessage]
+            mock_schema.assert_called_once()
+
+        # Later additions are picked up by the next read
+        registry.add(RefDummyMessage, "OtherConsumer")
+        assert RefDummyMessage in registry.consumer_messages["OtherConsumer"]
+        assert "RefDummyMessage" in registry.schema_objects
+
+    def test_build_error_is_raised_on_every_read(self) -> None:
+        """Test that a type failing to build keeps failing reads of the registry."""
+        registry = MessageRegistry()
+
+        registry.add(CallableMessage, "TestConsumer")
+        registry.add(DummyMessage, "TestConsumer")
+
+        with pytest.raises(PydanticInvalidForJsonSchema):
+            _ = registry.messages
+
+        # The failing type is not silently dropped from later reads
+        with pytest.raises(PydanticInvalidForJsonSchema):
+            _ = registry.schemas
@@ -192,6 +192,20 @@ class TestChannelsWebsocket(WebsocketTestCase):
         completion_msg = messages[-1]
         assert completion_msg["action"] != "complete"
 
+    @override_chanx_settings(SEND_COMPLETION=False)
+    async def test_receive_all_messages_count(self) -> None:
+        """Test receive_all_messages returns once count messages arrived."""
+        await self.auth_communicator.connect()
+
+        await self.auth_communicator.send_message(PingMessage())
+        await self.auth_communicator.send_message(PingMessage())
+
+        # No completion message is sent, so only count can end collection early
+        responses = await self.auth_communicator.receive_all_messages(
+            timeout=5, count=2
+        )
+        assert responses == [PongMessage(), PongMessage()]
+
     @override_chanx_settings(CAMELIZE=True)
     async def test_camelization(self) -> None:
         """Test that camelization works with Channels WebSocket testing."""